@@ -0,0 +1,84 @@
+"""
+Benchmark the Tk main-loop frame time while screenshots are being encoded.
+
+Encodes the same image repeatedly, once on a Python thread in the Tk process
+and once through the process pool, while a 16 ms Tk timer records how late
+each frame fires.
+
+Run from the project root:
+    python -m benchmarks.bench_encode_pool [image_path]
+"""
+
+import sys
+import time
+import threading
+import tkinter as tk
+from PIL import Image, ImageGrab
+from src.services.image_preprocessor import ImagePreprocessor
+from src.services.encode_pool import EncodePool
+
+FRAME_MS = 16
+ENCODES = 10
+
+
+def measure(root, encode):
+    """Run encode() ENCODES times on a thread and record frame intervals"""
+    intervals = []
+    done = threading.Event()
+    last = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        intervals.append((now - last[0]) * 1000)
+        last[0] = now
+        if done.is_set():
+            root.quit()
+        else:
+            root.after(FRAME_MS, tick)
+
+    def work():
+        for _ in range(ENCODES):
+            encode()
+        done.set()
+
+    threading.Thread(target=work, daemon=True).start()
+    root.after(FRAME_MS, tick)
+    root.mainloop()
+
+    intervals.sort()
+    p95 = intervals[int(len(intervals) * 0.95) - 1]
+    mean = sum(intervals) / len(intervals)
+    return mean, p95, intervals[-1]
+
+
+def run(image):
+    preprocessor = ImagePreprocessor()
+    pool = EncodePool()
+    pool.warm_up()
+    pool.encode(image, preprocessor)
+
+    root = tk.Tk()
+    root.withdraw()
+
+    print(f"Source image: {image.width}x{image.height}, {preprocessor.describe()}")
+    print(f"Target frame time: {FRAME_MS} ms")
+    print(f"{'engine':<16}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+
+    results = {
+        "thread": measure(root, lambda: preprocessor.to_data_url(image)),
+        "process pool": measure(root, lambda: pool.to_data_url(image, preprocessor)),
+    }
+    for engine, (mean, p95, worst) in results.items():
+        print(f"{engine:<16}{mean:>10.1f}{p95:>10.1f}{worst:>10.1f}")
+
+    root.destroy()
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        source = Image.open(sys.argv[1])
+        source.load()
+    else:
+        source = ImageGrab.grab()
+    run(source)
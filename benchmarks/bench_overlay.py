@@ -0,0 +1,81 @@
+"""
+Benchmark the latency from a "Select Region" click to a mapped overlay.
+
+Compares building a new overlay for every selection with showing the
+pre-warmed overlay that is created once at startup, optionally with a
+frozen-frame background.
+
+Run from the project root:
+    python -m benchmarks.bench_overlay [image_path]
+"""
+
+import sys
+import time
+import tkinter as tk
+from PIL import Image, ImageGrab
+from src.services.region_overlay import RegionOverlay
+
+ROUNDS = 10
+
+
+def time_until_mapped(root, overlay, background):
+    """Show the overlay and return the milliseconds until its window is mapped"""
+    mapped = []
+    binding = overlay.window.bind("<Map>", lambda event: mapped.append(True), "+")
+
+    start = time.perf_counter()
+    overlay.show(background)
+    while not mapped:
+        root.update()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    overlay.window.unbind("<Map>", binding)
+    overlay.hide()
+    root.update()
+    return elapsed
+
+
+def run(root, background):
+    cold = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        overlay = RegionOverlay(root)
+        build_ms = (time.perf_counter() - start) * 1000
+        cold.append(build_ms + time_until_mapped(root, overlay, background))
+        overlay.window.destroy()
+
+    overlay = RegionOverlay(root)
+    root.update()
+    warm = [time_until_mapped(root, overlay, background) for _ in range(ROUNDS)]
+    overlay.window.destroy()
+    return cold, warm
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    print(
+        f"{label:<28}{mean:>10.1f}{samples[len(samples) // 2]:>10.1f}{samples[-1]:>10.1f}"
+    )
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+
+    if len(sys.argv) > 1:
+        frame = Image.open(sys.argv[1]).convert("RGB")
+    else:
+        frame = ImageGrab.grab()
+
+    print(f"{'overlay':<28}{'mean ms':>10}{'p50 ms':>10}{'max ms':>10}")
+    for label, background in (("live", None), ("frozen", frame)):
+        cold, warm = run(root, background)
+        report(f"new per click ({label})", cold)
+        report(f"pre-warmed ({label})", warm)
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
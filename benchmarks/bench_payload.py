@@ -0,0 +1,69 @@
+"""
+Benchmark upload payload size and encode time for each preprocessing setting.
+
+Run from the project root:
+    python -m benchmarks.bench_payload [image_path]
+
+Without an image path the current screen is captured.
+"""
+
+import sys
+import time
+from PIL import Image, ImageGrab
+from src.services.image_preprocessor import ImagePreprocessor
+
+# (max_dimension, color_mode, image_format, png_compress_level, quality, auto_crop)
+SETTINGS_GRID = [
+    (0, "rgb", "PNG", 6, None, False),
+    (0, "rgb", "PNG", 1, None, False),
+    (0, "rgb", "PNG", 6, None, True),
+    (2560, "rgb", "PNG", 6, None, False),
+    (2560, "rgb", "PNG", 6, None, True),
+    (2560, "grayscale", "PNG", 6, None, True),
+    (2560, "palette", "PNG", 6, None, True),
+    (1920, "grayscale", "PNG", 9, None, True),
+    (2560, "rgb", "WEBP", None, 85, True),
+    (2560, "grayscale", "WEBP", None, 80, True),
+    (2560, "rgb", "JPEG", None, 85, True),
+    (1920, "grayscale", "JPEG", None, 80, True),
+]
+
+REPEATS = 3
+
+
+def run(image):
+    print(f"Source image: {image.width}x{image.height} {image.mode}")
+    print(f"{'setting':<40}{'size':>12}{'wire KB':>12}{'encode ms':>12}")
+
+    for row in SETTINGS_GRID:
+        max_dimension, color_mode, image_format, level, quality, auto_crop = row
+        preprocessor = ImagePreprocessor(
+            max_dimension=max_dimension,
+            color_mode=color_mode,
+            image_format=image_format,
+            png_compress_level=level,
+            quality=quality,
+            auto_crop=auto_crop,
+        )
+
+        best = None
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            data_url, metadata = preprocessor.to_data_url(image)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        size = "x".join(str(side) for side in metadata["size"])
+        print(
+            f"{preprocessor.describe():<40}{size:>12}"
+            f"{len(data_url) / 1024:>12.1f}{best * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        source = Image.open(sys.argv[1])
+        source.load()
+    else:
+        source = ImageGrab.grab()
+    run(source)
@@ -0,0 +1,88 @@
+"""
+Benchmark answer rendering for responses of 1, 50 and 500 questions.
+
+Compares the batched renderer, which inserts the whole document in one
+Text.insert call, with inserting the same segments one call at a time as
+the renderer used to. Also reports how many tags the widget holds after
+repeated renders.
+
+Run from the project root:
+    python -m benchmarks.bench_renderer
+"""
+
+import time
+import tkinter as tk
+from src.services.response_model import AnalysisResponse
+from src.ui.renderers.api_response_renderer import APIResponseRenderer
+
+SIZES = (1, 50, 500)
+ROUNDS = 5
+
+
+def sample_response(question_count):
+    """Build a response shaped like the API's with the given number of questions"""
+    questions = []
+    for idx in range(question_count):
+        questions.append(
+            {
+                "number": str(idx + 1),
+                "question_raw": f"Which of the following statements about topic {idx} "
+                "are correct? " * 2,
+                "answer_raw": [
+                    f"{choice}. Possible answer {choice} for question {idx}"
+                    for choice in range(1, 5)
+                ],
+                "answer": [choice == idx % 4 for choice in range(4)],
+                "reason": "The explanation covers why the marked choice is right "
+                "and why the other choices are not. " * 3,
+                "type_question": "single-choice",
+                "accuracy": f"{40 + (idx * 7) % 60}%",
+            }
+        )
+    return {"data": questions}
+
+
+def per_segment_render(renderer, text_widget, data):
+    """Baseline: one insert call per segment"""
+    renderer._prepare_text_widget(text_widget)
+    arguments = renderer.build_document(data)
+    for position in range(0, len(arguments), 2):
+        text_widget.insert("end", arguments[position], arguments[position + 1])
+    text_widget.see("1.0")
+    text_widget.config(state="disabled")
+
+
+def timed(root, function):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function()
+        root.update_idletasks()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+    text_widget = tk.Text(root, width=60, height=40, wrap="word")
+    text_widget.pack()
+    renderer = APIResponseRenderer()
+
+    print(f"{'questions':>10}{'build ms':>12}{'per-insert ms':>16}{'batched ms':>14}")
+    for size in SIZES:
+        response = AnalysisResponse.from_dict(sample_response(size))
+        data = response.questions
+        build = timed(root, lambda: renderer.build_document(data))
+        baseline = timed(root, lambda: per_segment_render(renderer, text_widget, data))
+        batched = timed(root, lambda: renderer.render(text_widget, response))
+        print(f"{size:>10}{build:>12.2f}{baseline:>16.2f}{batched:>14.2f}")
+
+    print(
+        f"tags after {ROUNDS * len(SIZES) * 2} renders: {len(text_widget.tag_names())}"
+    )
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
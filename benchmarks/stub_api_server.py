@@ -0,0 +1,161 @@
+"""
+Local stand-in for the analysis API that answers in JSON, NDJSON or SSE.
+
+Every request is answered with generated questions, each one delayed to
+mimic a model producing them in turn. In "auto" mode the server streams
+when the request's Accept header allows it and sends one JSON body
+otherwise, like a real server offering both.
+
+Serve it and point the API URL in the settings dialog at it:
+    python -m benchmarks.stub_api_server --mode auto --port 8765
+
+Or compare time to first question and total time of every mode:
+    python -m benchmarks.stub_api_server --bench
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from benchmarks.bench_renderer import sample_response
+from src.services.response_stream import STREAM_ACCEPT
+from src.services.retool_api_service import RetoolAPIService
+
+MODES = ("json", "ndjson", "sse")
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Answers POST requests with generated questions"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        # Connection warm-up
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        questions = sample_response(self.server.question_count)["data"]
+        mode = self.server.mode
+        if mode == "auto":
+            accept = self.headers.get("Accept", "")
+            if "application/x-ndjson" in accept:
+                mode = "ndjson"
+            elif "text/event-stream" in accept:
+                mode = "sse"
+            else:
+                mode = "json"
+
+        if mode == "json":
+            # Nothing is sent before the last question is ready
+            time.sleep(self.server.delay * len(questions))
+            body = json.dumps({"data": questions}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            "application/x-ndjson" if mode == "ndjson" else "text/event-stream",
+        )
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for question in questions:
+            time.sleep(self.server.delay)
+            event = json.dumps(question)
+            if mode == "ndjson":
+                self._write_chunk(f"{event}\n")
+            else:
+                self._write_chunk(f"event: question\ndata: {event}\n\n")
+        if mode == "sse":
+            self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(mode="auto", port=0, question_count=20, delay=0.1):
+    """Start the stub server on a background thread
+
+    Args:
+        mode (str): "auto" or one of MODES
+        port (int): Port to listen on, 0 for any free port
+        question_count (int): Questions in every response
+        delay (float): Seconds spent producing each question
+
+    Returns:
+        ThreadingHTTPServer: The running server, stop it with shutdown()
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubAPIHandler)
+    server.mode = mode
+    server.question_count = question_count
+    server.delay = delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench(question_count, delay):
+    """Time the first and the last question of every mode through the client"""
+    service = RetoolAPIService()
+    headers = {"Content-Type": "application/json", "Accept": STREAM_ACCEPT}
+    payload = {"file_name": "bench.png", "data": ""}
+
+    print(f"{'mode':>8}{'first ms':>12}{'total ms':>12}{'questions':>11}")
+    for mode in MODES:
+        server = serve(mode, 0, question_count, delay)
+        service.api_url = f"http://127.0.0.1:{server.server_address[1]}/"
+        first = []
+
+        def on_question(question):
+            if not first:
+                first.append(time.perf_counter())
+
+        start = time.perf_counter()
+        response = service._post(payload, headers, on_question=on_question)
+        end = time.perf_counter()
+        # A plain JSON body delivers every question at once
+        first_ms = ((first[0] if first else end) - start) * 1000
+        print(
+            f"{mode:>8}{first_ms:>12.1f}{(end - start) * 1000:>12.1f}"
+            f"{len(response.questions):>11}"
+        )
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=("auto",) + MODES, default="auto")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.1)
+    parser.add_argument("--bench", action="store_true")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.questions, args.delay)
+        return
+
+    server = serve(args.mode, args.port, args.questions, args.delay)
+    print(f"Stub API ({args.mode}) listening on http://127.0.0.1:{args.port}/")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
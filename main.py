@@ -1,3 +1,4 @@
+from multiprocessing import freeze_support
 from src.ui.main_window import MainWindow
 from src.settings.settings import Settings
 from src.utils.logger import get_logger
@@ -19,4 +20,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the encoding process pool in the packaged executable
+    freeze_support()
     main()
@@ -0,0 +1,150 @@
+"""
+asyncio backend for the Retool API that keeps several requests in flight.
+"""
+
+import asyncio
+import threading
+import aiohttp
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.services.response_stream import StreamDecoder, stream_format
+from src.services.response_model import AnalysisResponse, body_digest, dumps
+
+logger = get_logger()
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_async_client():
+    """Return the process-wide asyncio client, starting its loop on first use
+
+    Returns:
+        AsyncAPIClient: The running client
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                client = AsyncAPIClient()
+                client.start()
+                _shared_client = client
+    return _shared_client
+
+
+class AsyncAPIClient:
+    """aiohttp client running on a dedicated event loop thread"""
+
+    def __init__(self, max_in_flight=None):
+        """
+        Initialize the client. Call start() before submitting requests.
+
+        Args:
+            max_in_flight (int): Maximum number of concurrent requests
+        """
+        self.max_in_flight = max_in_flight or Settings.API_MAX_IN_FLIGHT
+        self.in_flight = 0
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._semaphore = None
+        self._ready = threading.Event()
+
+    def start(self):
+        """Start the event loop thread and open the HTTP session"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run_loop, name="AsyncAPIClient", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        """Entry point of the event loop thread"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._open())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _open(self):
+        """Create the session and concurrency limit on the loop thread"""
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_in_flight,
+            force_close=not Settings.HTTP_KEEP_ALIVE,
+        )
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=Settings.HTTP_CONNECT_TIMEOUT,
+            sock_read=Settings.HTTP_READ_TIMEOUT,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        logger.info(f"Async API client started ({self.max_in_flight} in flight)")
+
+    def submit(self, url, payload, headers, deadline=None, on_question=None):
+        """Queue a POST request on the event loop. Safe to call from any thread.
+
+        Args:
+            url (str): Endpoint URL
+            payload (dict): JSON body
+            headers (dict): Request headers
+            deadline (float): Seconds from submission before the request is abandoned
+            on_question: Called on the loop thread with each question of a
+                streamed response
+
+        Returns:
+            concurrent.futures.Future: Resolves to the AnalysisResponse.
+            Calling cancel() on it cancels the request on the loop.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._post(url, payload, headers, deadline, on_question), self._loop
+        )
+
+    async def _post(self, url, payload, headers, deadline, on_question=None):
+        """Wait for a free slot and send the request within the deadline"""
+        try:
+            return await asyncio.wait_for(
+                self._post_when_free(url, payload, headers, on_question), deadline
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"API request exceeded its deadline of {deadline}s")
+            return AnalysisResponse.failure(
+                f"Request exceeded its deadline of {deadline}s"
+            )
+        except aiohttp.ClientError as e:
+            logger.error(f"API request failed: {str(e)}")
+            return AnalysisResponse.failure(str(e))
+
+    async def _post_when_free(self, url, payload, headers, on_question=None):
+        """Send the request once the in-flight limit allows it"""
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                async with self._session.post(
+                    url, data=dumps(payload), headers=headers
+                ) as response:
+                    format_name = stream_format(response.headers.get("Content-Type"))
+                    if on_question is not None and format_name is not None:
+                        logger.info(f"Reading {format_name} response stream")
+                        decoder = StreamDecoder(format_name, on_question)
+                        async for line in response.content:
+                            decoder.feed_line(line)
+                        logger.info(f"{response.status = }")
+                        return decoder.finish()
+                    body = await response.read()
+                    logger.info(f"{response.status = }")
+                    logger.info(f"Response body: {body_digest(body)}")
+                    return AnalysisResponse.from_json(body)
+            finally:
+                self.in_flight -= 1
+
+    def close(self):
+        """Close the session and stop the event loop thread"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
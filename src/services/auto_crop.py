@@ -0,0 +1,130 @@
+"""
+Content-aware cropping that trims empty borders from screenshots before upload.
+"""
+
+import numpy as np
+from PIL import Image
+from src.settings.settings import Settings
+
+
+class AutoCropper:
+    """Finds the text content of a screenshot and crops everything around it"""
+
+    def __init__(
+        self,
+        threshold=None,
+        margin=None,
+        uniform_spread=None,
+        drop_bands=None,
+        band_min_height=None,
+    ):
+        """
+        Initialize the cropper. Unset options fall back to the settings.
+
+        Args:
+            threshold (int): Gray-level difference from the background that counts as content
+            margin (int): Pixels of padding kept around the content
+            uniform_spread (int): Rows or columns whose max-min gray spread is at
+                or below this value are treated as flat bands (title bars, margins)
+            drop_bands (bool): Also remove tall flat bands inside the content
+            band_min_height (int): Minimum height of an inner band to remove
+        """
+        self.threshold = (
+            Settings.AUTO_CROP_THRESHOLD if threshold is None else threshold
+        )
+        self.margin = Settings.AUTO_CROP_MARGIN if margin is None else margin
+        self.uniform_spread = (
+            Settings.AUTO_CROP_UNIFORM_SPREAD
+            if uniform_spread is None
+            else uniform_spread
+        )
+        self.drop_bands = (
+            Settings.AUTO_CROP_DROP_BANDS if drop_bands is None else drop_bands
+        )
+        self.band_min_height = band_min_height or Settings.AUTO_CROP_BAND_MIN_HEIGHT
+
+    def crop(self, image):
+        """Crop an image to its content
+
+        Args:
+            image: PIL Image object, left untouched
+
+        Returns:
+            tuple: (cropped PIL Image, metadata dict with the crop box in
+            original image coordinates and any removed inner bands)
+        """
+        gray = np.asarray(image.convert("L"))
+        content_rows, content_cols = self._content_mask(gray)
+
+        rows = np.flatnonzero(content_rows)
+        cols = np.flatnonzero(content_cols)
+        if rows.size == 0 or cols.size == 0:
+            # Nothing that looks like content, send the frame as it is
+            return image, {"crop_box": [0, 0, image.width, image.height]}
+
+        left = max(0, int(cols[0]) - self.margin)
+        top = max(0, int(rows[0]) - self.margin)
+        right = min(image.width, int(cols[-1]) + 1 + self.margin)
+        bottom = min(image.height, int(rows[-1]) + 1 + self.margin)
+
+        cropped = image.crop((left, top, right, bottom))
+        metadata = {"crop_box": [left, top, right, bottom]}
+
+        if self.drop_bands:
+            cropped, bands = self._drop_inner_bands(cropped, content_rows[top:bottom])
+            if bands:
+                metadata["removed_bands"] = [
+                    [top + band_top, top + band_bottom]
+                    for band_top, band_bottom in bands
+                ]
+
+        return cropped, metadata
+
+    def _content_mask(self, gray):
+        """Flag the rows and columns that contain content
+
+        A row or column is content when it has pixels that differ from the
+        background and is not a flat band of a single color.
+        """
+        border = np.concatenate((gray[0], gray[-1], gray[:, 0], gray[:, -1]))
+        background = int(np.median(border))
+
+        # Lookup table avoids a widened copy of the whole frame
+        levels = np.arange(256, dtype=np.int16)
+        is_content = (np.abs(levels - background) > self.threshold)[gray]
+
+        row_spread = gray.max(axis=1).astype(np.int16) - gray.min(axis=1)
+        col_spread = gray.max(axis=0).astype(np.int16) - gray.min(axis=0)
+
+        content_rows = is_content.any(axis=1) & (row_spread > self.uniform_spread)
+        content_cols = is_content.any(axis=0) & (col_spread > self.uniform_spread)
+        return content_rows, content_cols
+
+    def _drop_inner_bands(self, image, content_rows):
+        """Remove tall runs of empty rows, keeping a margin on both sides
+
+        Returns:
+            tuple: (stitched PIL Image, list of removed (top, bottom) row ranges)
+        """
+        # Run boundaries of the empty rows, padded so every run has a start and end
+        empty = np.concatenate(([False], ~content_rows, [False]))
+        edges = np.flatnonzero(np.diff(empty.astype(np.int8)))
+        starts, ends = edges[::2], edges[1::2]
+
+        bands = []
+        keep = np.ones(len(content_rows), dtype=bool)
+        for start, end in zip(starts, ends):
+            if end - start < self.band_min_height:
+                continue
+            band_top = int(start) + self.margin
+            band_bottom = int(end) - self.margin
+            if band_bottom <= band_top:
+                continue
+            keep[band_top:band_bottom] = False
+            bands.append((band_top, band_bottom))
+
+        if not bands:
+            return image, bands
+
+        pixels = np.asarray(image)
+        return Image.fromarray(pixels[keep]), bands
@@ -0,0 +1,291 @@
+"""
+Append-only archive of analyzed captures and their API responses.
+"""
+
+import os
+import mmap
+import time
+import struct
+import hashlib
+import threading
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.services.response_model import AnalysisResponse
+
+logger = get_logger()
+
+_INDEX_MAGIC = b"CAPIDX01"
+# timestamp, payload hash, payload offset, payload length, width, height,
+# response offset, response length
+_RECORD = struct.Struct("<d16sQIIIQI")
+
+_shared_archive = None
+_shared_archive_lock = threading.Lock()
+
+
+def get_capture_archive():
+    """Return the process-wide capture archive, opening it on first use
+
+    Returns:
+        CaptureArchive: The shared archive
+    """
+    global _shared_archive
+    if _shared_archive is None:
+        with _shared_archive_lock:
+            if _shared_archive is None:
+                app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                _shared_archive = CaptureArchive(
+                    os.path.join(app_root, Settings.ARCHIVE_DIR)
+                )
+    return _shared_archive
+
+
+class ArchiveEntry:
+    """Index record of one archived capture"""
+
+    def __init__(self, entry_id, record):
+        """
+        Args:
+            entry_id (int): Position of the record in the index
+            record (tuple): Unpacked index record
+        """
+        self.entry_id = entry_id
+        (
+            self.timestamp,
+            digest,
+            self.offset,
+            self.length,
+            self.width,
+            self.height,
+            self.response_offset,
+            self.response_length,
+        ) = record
+        self.hash = digest.hex()
+
+    @property
+    def has_response(self):
+        return self.response_length > 0
+
+
+class CaptureArchive:
+    """Pack file of encoded captures and responses with a fixed-size record index
+
+    captures.pack only ever grows: payloads and response JSON are appended
+    to it. captures.idx holds one fixed-size record per capture, so entry
+    N sits at a computable offset, and a hash map built on open finds
+    captures by content. Reads slice a memory map of the pack file instead
+    of opening one file per capture.
+    """
+
+    def __init__(self, directory):
+        """
+        Open the archive, creating it if needed.
+
+        Args:
+            directory (str): Directory holding the pack and index files
+        """
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+        self.pack_path = os.path.join(self.directory, "captures.pack")
+        self.index_path = os.path.join(self.directory, "captures.idx")
+
+        self._lock = threading.Lock()
+        self._pack = open(self.pack_path, "a+b")
+        self._index = open(self.index_path, "a+b")
+        self._pack_map = None
+        self._records = []
+        # Payload hash -> entry id of its latest capture
+        self._by_hash = {}
+        self._load_index()
+
+    def __len__(self):
+        return len(self._records)
+
+    def append(self, payload, width, height, timestamp=None):
+        """Store an encoded capture
+
+        Identical payloads are stored once; appending one again returns
+        the existing entry.
+
+        Args:
+            payload (bytes): Encoded image bytes
+            width (int): Image width
+            height (int): Image height
+            timestamp (float): Capture time, defaults to now
+
+        Returns:
+            int: Entry id of the capture
+        """
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        with self._lock:
+            existing = self._by_hash.get(digest)
+            if existing is not None:
+                return existing
+
+            offset = self._append_to_pack(payload)
+            record = (
+                timestamp or time.time(),
+                digest,
+                offset,
+                len(payload),
+                width,
+                height,
+                0,
+                0,
+            )
+            entry_id = len(self._records)
+            self._index.write(_RECORD.pack(*record))
+            self._index.flush()
+            self._records.append(record)
+            self._by_hash[digest] = entry_id
+        logger.debug(f"Archived capture {entry_id} ({len(payload)} bytes)")
+        return entry_id
+
+    def set_response(self, entry_id, response):
+        """Attach the API response to a capture, replacing an earlier one
+
+        Args:
+            entry_id (int): Entry id returned by append()
+            response (AnalysisResponse): Decoded API response
+        """
+        data = response.to_json()
+        with self._lock:
+            offset = self._append_to_pack(data)
+            record = self._records[entry_id][:6] + (offset, len(data))
+            # Index records are fixed size, so only this record is rewritten
+            with open(self.index_path, "r+b") as index:
+                index.seek(len(_INDEX_MAGIC) + entry_id * _RECORD.size)
+                index.write(_RECORD.pack(*record))
+            self._records[entry_id] = record
+
+    def entry(self, entry_id):
+        """Return the index record of a capture
+
+        Args:
+            entry_id (int): Entry id
+
+        Returns:
+            ArchiveEntry: The record
+        """
+        return ArchiveEntry(entry_id, self._records[entry_id])
+
+    def entries(self, start, count):
+        """Return a page of records, newest first
+
+        Args:
+            start (int): Number of newest entries to skip
+            count (int): Maximum number of entries to return
+
+        Returns:
+            list: ArchiveEntry objects
+        """
+        newest = len(self._records) - 1 - start
+        oldest = max(-1, newest - count)
+        return [self.entry(entry_id) for entry_id in range(newest, oldest, -1)]
+
+    def find(self, payload_hash):
+        """Return the entry id of a payload hash, or None
+
+        Args:
+            payload_hash (str): Hex digest as in ArchiveEntry.hash
+        """
+        return self._by_hash.get(bytes.fromhex(payload_hash))
+
+    def read_payload(self, entry_id):
+        """Return the encoded image bytes of a capture
+
+        Args:
+            entry_id (int): Entry id
+
+        Returns:
+            bytes: Encoded image
+        """
+        record = self._records[entry_id]
+        return self._read(record[2], record[3])
+
+    def read_response(self, entry_id):
+        """Return the stored API response of a capture
+
+        Args:
+            entry_id (int): Entry id
+
+        Returns:
+            AnalysisResponse: The response, or None if the capture has none
+        """
+        record = self._records[entry_id]
+        if not record[7]:
+            return None
+        return AnalysisResponse.from_json(self._read(record[6], record[7]))
+
+    def close(self):
+        """Close the archive files"""
+        with self._lock:
+            if self._pack_map is not None:
+                self._pack_map.close()
+                self._pack_map = None
+            self._pack.close()
+            self._index.close()
+
+    def _append_to_pack(self, data):
+        """Append bytes to the pack file; caller holds the lock"""
+        self._pack.seek(0, os.SEEK_END)
+        offset = self._pack.tell()
+        self._pack.write(data)
+        self._pack.flush()
+        return offset
+
+    def _read(self, offset, length):
+        """Slice the memory-mapped pack, remapping after it has grown"""
+        with self._lock:
+            end = offset + length
+            if self._pack_map is None or len(self._pack_map) < end:
+                if self._pack_map is not None:
+                    self._pack_map.close()
+                self._pack_map = mmap.mmap(
+                    self._pack.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            return self._pack_map[offset:end]
+
+    def _load_index(self):
+        """Read the index, dropping a torn trailing record or one past the pack's end"""
+        self._index.seek(0)
+        data = self._index.read()
+        if not data:
+            self._index.write(_INDEX_MAGIC)
+            self._index.flush()
+            return
+        if not data.startswith(_INDEX_MAGIC):
+            self._reset_index()
+            return
+
+        pack_size = os.path.getsize(self.pack_path)
+        body = memoryview(data)[len(_INDEX_MAGIC) :]
+        count = len(body) // _RECORD.size
+        for record in _RECORD.iter_unpack(body[: count * _RECORD.size]):
+            if record[2] + record[3] > pack_size or record[6] + record[7] > pack_size:
+                break
+            self._by_hash[record[1]] = len(self._records)
+            self._records.append(record)
+
+        valid_size = len(_INDEX_MAGIC) + len(self._records) * _RECORD.size
+        if valid_size != len(data):
+            logger.warning(
+                f"Capture index truncated to {len(self._records)} valid records"
+            )
+            self._index.truncate(valid_size)
+        logger.info(f"Capture archive opened with {len(self._records)} entries")
+
+    def _reset_index(self):
+        """Move an unreadable index aside and start an empty one
+
+        The pack file is kept; captures appended from now on are indexed again.
+        """
+        corrupt_path = f"{self.index_path}.corrupt-{int(time.time())}"
+        logger.error(
+            f"{self.index_path} is not a capture index, moving it to {corrupt_path}"
+        )
+        self._index.close()
+        os.replace(self.index_path, corrupt_path)
+        self._index = open(self.index_path, "a+b")
+        self._index.write(_INDEX_MAGIC)
+        self._index.flush()
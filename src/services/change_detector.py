@@ -0,0 +1,128 @@
+"""
+Cheap frame-to-frame change detection for watch mode.
+"""
+
+import numpy as np
+from PIL import Image
+from src.settings.settings import Settings
+
+# Samples per thumbnail pixel along each axis
+_OVERSAMPLE = 4
+
+
+class ChangeDetector:
+    """Decides when a watched region shows new content
+
+    Each frame is reduced to a small grayscale thumbnail and compared with
+    the thumbnail of the last reported frame. A change is only reported
+    once the new content has been stable for a few frames, so scrolling or
+    a transition animation is not submitted halfway through.
+    """
+
+    def __init__(
+        self,
+        diff_size=None,
+        pixel_threshold=None,
+        change_threshold=None,
+        settle_frames=None,
+    ):
+        """
+        Initialize the detector. Unset options fall back to the settings.
+
+        Args:
+            diff_size (int): Longest side of the thumbnail that is compared
+            pixel_threshold (int): Gray-level difference that counts as a changed pixel
+            change_threshold (float): Fraction of changed pixels that counts as new content
+            settle_frames (int): Consecutive matching frames required before reporting
+        """
+        self.diff_size = diff_size or Settings.WATCH_DIFF_SIZE
+        self.pixel_threshold = (
+            Settings.WATCH_PIXEL_THRESHOLD
+            if pixel_threshold is None
+            else pixel_threshold
+        )
+        self.change_threshold = (
+            Settings.WATCH_CHANGE_THRESHOLD
+            if change_threshold is None
+            else change_threshold
+        )
+        self.settle_frames = (
+            Settings.WATCH_SETTLE_FRAMES if settle_frames is None else settle_frames
+        )
+        self.reset()
+
+    def reset(self, image=None):
+        """Forget the reported frame, optionally starting from a known one
+
+        Args:
+            image: PIL Image that counts as already reported, or None
+        """
+        self._reference = None if image is None else self.fingerprint(image)
+        self._candidate = None
+        self._stable_frames = 0
+
+    def fingerprint(self, image):
+        """Reduce a frame to a small grayscale array
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            numpy.ndarray: int16 thumbnail, ready for subtraction
+        """
+        # Point-sample a grid a few times denser than the thumbnail, then
+        # average it down: a fraction of the cost of filtering every pixel
+        thumbnail = image
+        scale = max(image.size) / (self.diff_size * _OVERSAMPLE)
+        if scale > 1:
+            sample_size = (
+                max(_OVERSAMPLE, round(image.width / scale)),
+                max(_OVERSAMPLE, round(image.height / scale)),
+            )
+            thumbnail = image.resize(sample_size, Image.Resampling.NEAREST)
+            thumbnail = thumbnail.reduce(_OVERSAMPLE)
+        return np.asarray(thumbnail.convert("L"), dtype=np.int16)
+
+    def difference(self, first, second):
+        """Fraction of thumbnail pixels that differ between two fingerprints"""
+        if first.shape != second.shape:
+            return 1.0
+        changed = np.abs(first - second) > self.pixel_threshold
+        return float(changed.mean())
+
+    def update(self, image):
+        """Feed the next frame
+
+        Args:
+            image: PIL Image of the watched region
+
+        Returns:
+            bool: True if the frame shows settled new content and should be submitted
+        """
+        current = self.fingerprint(image)
+        if self._reference is None:
+            self._reference = current
+            return True
+
+        if self.difference(current, self._reference) <= self.change_threshold:
+            # Back to (or still on) the reported content
+            self._candidate = None
+            self._stable_frames = 0
+            return False
+
+        if (
+            self._candidate is not None
+            and self.difference(current, self._candidate) <= self.change_threshold
+        ):
+            self._stable_frames += 1
+        else:
+            self._candidate = current
+            self._stable_frames = 0
+
+        if self._stable_frames < self.settle_frames:
+            return False
+
+        self._reference = current
+        self._candidate = None
+        self._stable_frames = 0
+        return True
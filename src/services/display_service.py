@@ -0,0 +1,253 @@
+"""
+Display enumeration so captures can target a single monitor.
+"""
+
+import sys
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # Report real pixels on every monitor, like ImageGrab does while grabbing
+    _DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = ctypes.c_void_p(-4)
+    _MONITORINFOF_PRIMARY = 1
+
+    class _MONITORINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", wintypes.RECT),
+            ("rcWork", wintypes.RECT),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    _MonitorEnumProc = ctypes.WINFUNCTYPE(
+        wintypes.BOOL,
+        wintypes.HMONITOR,
+        wintypes.HDC,
+        ctypes.POINTER(wintypes.RECT),
+        wintypes.LPARAM,
+    )
+
+
+class Display:
+    """One monitor, positioned in virtual-screen pixel coordinates"""
+
+    def __init__(self, index, left, top, width, height, primary=False, tk_rect=None):
+        """
+        Args:
+            index (int): Position in the enumeration order
+            left (int): Left edge in virtual-screen pixels
+            top (int): Top edge in virtual-screen pixels
+            width (int): Width in pixels
+            height (int): Height in pixels
+            primary (bool): Whether this is the primary display
+            tk_rect (tuple): (left, top, width, height) of the display in Tk
+                pixels, which differ from real pixels on a scaled display.
+                Defaults to the pixel rectangle.
+        """
+        self.index = index
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.primary = primary
+        self.tk_rect = tk_rect or (left, top, width, height)
+
+    @property
+    def bbox(self):
+        """(left, top, right, bottom) for ImageGrab.grab"""
+        return (self.left, self.top, self.left + self.width, self.top + self.height)
+
+    def contains(self, x, y):
+        """Whether a virtual-screen point lies on this display"""
+        left, top, right, bottom = self.bbox
+        return left <= x < right and top <= y < bottom
+
+    def contains_tk(self, x, y):
+        """Whether a point in Tk pixels lies on this display"""
+        left, top, width, height = self.tk_rect
+        return left <= x < left + width and top <= y < top + height
+
+    def to_pixels(self, x, y):
+        """Map a point in Tk pixels on this display to virtual-screen pixels"""
+        tk_left, tk_top, tk_width, tk_height = self.tk_rect
+        return (
+            self.left + round((x - tk_left) * self.width / tk_width),
+            self.top + round((y - tk_top) * self.height / tk_height),
+        )
+
+    def __repr__(self):
+        primary = ", primary" if self.primary else ""
+        return (
+            f"Display({self.index}: {self.width}x{self.height}"
+            f"+{self.left}+{self.top}{primary})"
+        )
+
+
+def list_displays(root=None):
+    """Enumerate the connected displays
+
+    Uses EnumDisplayMonitors on Windows. Elsewhere Tk only knows the
+    combined screen, which is reported as a single display.
+
+    Args:
+        root: Any Tk widget, used by the fallback
+
+    Returns:
+        list: Display objects, primary display first
+    """
+    if sys.platform == "win32":
+        try:
+            displays = _list_windows_displays()
+            if displays:
+                return displays
+        except Exception as e:
+            logger.warning(f"Monitor enumeration failed, using Tk: {str(e)}")
+
+    if root is None:
+        return []
+    return [Display(0, 0, 0, root.winfo_screenwidth(), root.winfo_screenheight(), True)]
+
+
+def cursor_position(root=None):
+    """Return the mouse position in virtual-screen pixels, or None if unknown
+
+    Args:
+        root: Any Tk widget, used by the fallback
+    """
+    if sys.platform == "win32":
+        point = wintypes.POINT()
+        with _PerMonitorDpiAwareness():
+            if ctypes.windll.user32.GetCursorPos(ctypes.byref(point)):
+                return point.x, point.y
+    if root is not None:
+        return root.winfo_pointerxy()
+    return None
+
+
+def resolve_display(choice, root=None, displays=None):
+    """Pick the display to capture for a CAPTURE_DISPLAY setting
+
+    Args:
+        choice: "cursor", "primary", "all" or a display index
+        root: Any Tk widget, used by the fallbacks
+        displays: Already enumerated displays, enumerated now if None
+
+    Returns:
+        Display to capture, or None for the whole virtual screen
+    """
+    if choice == "all":
+        return None
+    displays = displays if displays is not None else list_displays(root)
+    if not displays:
+        return None
+
+    if choice == "cursor":
+        position = cursor_position(root)
+        if position is not None:
+            for display in displays:
+                if display.contains(*position):
+                    return display
+    elif isinstance(choice, int) and 0 <= choice < len(displays):
+        return displays[choice]
+
+    return next((display for display in displays if display.primary), displays[0])
+
+
+def tk_to_pixels(displays, x, y):
+    """Map a point in Tk pixels to virtual-screen pixels
+
+    Each display has its own scale when monitors use different DPI
+    settings, so the point is mapped through the display it lies on.
+
+    Args:
+        displays: Enumerated displays
+        x (int): Horizontal position in Tk pixels
+        y (int): Vertical position in Tk pixels
+
+    Returns:
+        tuple: (x, y) in virtual-screen pixels
+    """
+    display = next((display for display in displays if display.contains_tk(x, y)), None)
+    if display is None:
+        display = next((display for display in displays if display.primary), None)
+    if display is None:
+        return x, y
+    return display.to_pixels(x, y)
+
+
+def _list_windows_displays():
+    """EnumDisplayMonitors with per-monitor DPI awareness on this thread"""
+    user32 = ctypes.windll.user32
+    monitors = []
+
+    def on_monitor(handle, hdc, rect, data):
+        info = _monitor_info(handle)
+        if info is not None:
+            area = info.rcMonitor
+            monitors.append(
+                (
+                    area.left,
+                    area.top,
+                    area.right - area.left,
+                    area.bottom - area.top,
+                    bool(info.dwFlags & _MONITORINFOF_PRIMARY),
+                    handle,
+                )
+            )
+        return True
+
+    with _PerMonitorDpiAwareness():
+        user32.EnumDisplayMonitors(None, None, _MonitorEnumProc(on_monitor), 0)
+
+    # Primary first, the others left to right
+    monitors.sort(key=lambda monitor: (not monitor[4], monitor[0], monitor[1]))
+    displays = []
+    for index, (left, top, width, height, primary, handle) in enumerate(monitors):
+        # Asked again in this thread's own DPI awareness, the one Tk runs in,
+        # the monitor rectangle comes back in Tk pixels
+        info = _monitor_info(handle)
+        tk_rect = None
+        if info is not None:
+            area = info.rcMonitor
+            tk_rect = (
+                area.left,
+                area.top,
+                area.right - area.left,
+                area.bottom - area.top,
+            )
+        displays.append(Display(index, left, top, width, height, primary, tk_rect))
+    return displays
+
+
+def _monitor_info(handle):
+    """GetMonitorInfoW for a monitor handle, or None if the call fails"""
+    info = _MONITORINFO()
+    info.cbSize = ctypes.sizeof(_MONITORINFO)
+    if ctypes.windll.user32.GetMonitorInfoW(handle, ctypes.byref(info)):
+        return info
+    return None
+
+
+class _PerMonitorDpiAwareness:
+    """Temporarily make the calling thread per-monitor DPI aware (Windows 10+)"""
+
+    def __enter__(self):
+        self._previous = None
+        set_context = getattr(
+            ctypes.windll.user32, "SetThreadDpiAwarenessContext", None
+        )
+        if set_context is not None:
+            set_context.restype = ctypes.c_void_p
+            self._previous = set_context(_DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._previous:
+            ctypes.windll.user32.SetThreadDpiAwarenessContext(
+                ctypes.c_void_p(self._previous)
+            )
+        return False
@@ -0,0 +1,152 @@
+"""
+Speculative encoding that prepares the upload payload as soon as a screenshot is captured.
+"""
+
+import base64
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from src.utils.logger import get_logger
+from src.services.image_preprocessor import ImagePreprocessor
+from src.services.encode_pool import encode_image, get_encode_pool
+from src.services.result_cache import content_digest
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+
+class EncodedPayload:
+    """Upload-ready form of a screenshot"""
+
+    def __init__(self, image_bytes, mime_type, metadata):
+        """
+        Args:
+            image_bytes (bytes): The encoded image
+            mime_type (str): MIME type of the encoded image
+            metadata (dict): Crop box, scale and sizes from preprocessing
+        """
+        self.image_bytes = image_bytes
+        self.metadata = metadata
+        # Built here so the speculative job also pays for the base64 step
+        base64_string = base64.b64encode(image_bytes).decode("utf-8")
+        self.data_url = f"data:{mime_type};base64,{base64_string}"
+
+
+class SpeculativeEncoder:
+    """Encodes the current screenshot in the background before it is analyzed"""
+
+    def __init__(self, result_cache=None):
+        """
+        Initialize the encoder.
+
+        Args:
+            result_cache: Optional ResultCache; content digests are computed ahead
+        """
+        self.result_cache = result_cache
+        self.preprocessor = ImagePreprocessor()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SpeculativeEncoder"
+        )
+        self._lock = threading.Lock()
+        self._frame = None
+        self._digest_future = None
+        self._payload_future = None
+
+        # Spawn the encoding processes now rather than on the first capture
+        if Settings.ENCODE_PROCESS_POOL:
+            get_encode_pool().warm_up()
+
+    def submit(self, frame):
+        """Start preparing a new screenshot, superseding the previous one
+
+        The encoder holds a reference to the frame until it is superseded
+        or cancelled.
+
+        Args:
+            frame: Frame that will later be analyzed
+        """
+        self.cancel()
+        with self._lock:
+            self._frame = frame.acquire()
+            if self.result_cache is not None:
+                self._digest_future = self._executor.submit(self._digest, frame)
+            self._payload_future = self._executor.submit(self._encode, frame)
+        logger.debug(f"Speculative encode queued for {frame.width}x{frame.height}")
+
+    def cancel(self):
+        """Drop the speculative work for the current screenshot
+
+        Jobs that have not started are cancelled; a job already running
+        finishes in the background and its result is discarded.
+        """
+        with self._lock:
+            for future in (self._digest_future, self._payload_future):
+                if future is not None:
+                    future.cancel()
+            frame = self._frame
+            self._frame = None
+            self._digest_future = None
+            self._payload_future = None
+        if frame is not None:
+            frame.release()
+
+    def cache_key_for(self, frame, api_url):
+        """Return the result cache key of a frame
+
+        Args:
+            frame: Frame to look up
+            api_url (str): URL the frame will be sent to
+
+        Returns:
+            The key, or None when no result cache is configured
+        """
+        if self.result_cache is None:
+            return None
+        digest = None
+        future = self._future_for(frame, "_digest_future")
+        if future is not None:
+            try:
+                digest = future.result()
+            except CancelledError:
+                pass
+        if digest is None:
+            digest = self._digest(frame)
+        return self.result_cache.make_key(
+            digest, api_url, self.preprocessor.get_options()
+        )
+
+    def payload_for(self, frame):
+        """Return the encoded payload of a frame
+
+        Waits for the speculative job if it was started for this frame,
+        otherwise encodes on the calling thread.
+
+        Args:
+            frame: Frame to encode
+
+        Returns:
+            EncodedPayload: The upload-ready payload
+        """
+        future = self._future_for(frame, "_payload_future")
+        if future is not None:
+            try:
+                return future.result()
+            except CancelledError:
+                pass
+        logger.debug("No speculative payload available, encoding now")
+        return self._encode(frame)
+
+    def _future_for(self, frame, attribute):
+        """Return the pending future of the given kind if it belongs to frame"""
+        with self._lock:
+            if self._frame is not frame:
+                return None
+            return getattr(self, attribute)
+
+    def _digest(self, frame):
+        """Compute the content digest of a frame for the result cache"""
+        return content_digest(frame.image)
+
+    def _encode(self, frame):
+        """Encode a frame for upload"""
+        image_bytes, metadata = encode_image(frame.image, self.preprocessor)
+        return EncodedPayload(image_bytes, self.preprocessor.mime_type, metadata)
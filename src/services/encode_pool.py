@@ -0,0 +1,136 @@
+"""
+Process-pool encoding engine that keeps PNG compression off the Tk process's GIL.
+"""
+
+import os
+import base64
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.services.encode_worker import encode_shared_image, ping
+
+logger = get_logger()
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_encode_pool():
+    """Return the process-wide encoding pool, creating it on first use
+
+    Returns:
+        EncodePool: The shared pool
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = EncodePool()
+    return _shared_pool
+
+
+def encode_image(image, preprocessor):
+    """Encode an image, in the process pool when enabled
+
+    Args:
+        image: PIL Image object
+        preprocessor: ImagePreprocessor holding the encoding options
+
+    Returns:
+        tuple: (encoded bytes, metadata dict)
+    """
+    if Settings.ENCODE_PROCESS_POOL:
+        return get_encode_pool().encode(image, preprocessor)
+    return preprocessor.encode(image)
+
+
+def encode_to_data_url(image, preprocessor):
+    """Encode an image as a data URL, in the process pool when enabled
+
+    Args:
+        image: PIL Image object
+        preprocessor: ImagePreprocessor holding the encoding options
+
+    Returns:
+        tuple: (data URL, metadata dict)
+    """
+    if Settings.ENCODE_PROCESS_POOL:
+        return get_encode_pool().to_data_url(image, preprocessor)
+    return preprocessor.to_data_url(image)
+
+
+class EncodePool:
+    """Encodes images in worker processes that read pixels from shared memory"""
+
+    def __init__(self, max_workers=None):
+        """
+        Initialize the pool. Worker processes are spawned lazily.
+
+        Args:
+            max_workers (int): Number of worker processes
+        """
+        self.max_workers = max_workers or Settings.ENCODE_POOL_WORKERS
+        if os.name == "posix":
+            # Workers must share the parent's tracker, otherwise each one
+            # reports the blocks it attached to as leaked on exit
+            resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def warm_up(self):
+        """Start the worker processes in the background"""
+        for _ in range(self.max_workers):
+            self._executor.submit(ping)
+
+    def encode(self, image, preprocessor):
+        """Encode an image in a worker process
+
+        The pixels are packed with tobytes() and that buffer is copied into
+        a shared memory block, two full-frame copies on the calling thread.
+        Only the block's name, mode and size are pickled to the worker.
+
+        Args:
+            image: PIL Image object
+            preprocessor: ImagePreprocessor holding the encoding options
+
+        Returns:
+            tuple: (encoded bytes, metadata dict)
+        """
+        if image.mode not in ("RGB", "RGBA", "L"):
+            image = image.convert("RGB")
+
+        raw = image.tobytes()
+        shm = shared_memory.SharedMemory(create=True, size=len(raw))
+        try:
+            shm.buf[: len(raw)] = raw
+            del raw
+            future = self._executor.submit(
+                encode_shared_image,
+                shm.name,
+                image.mode,
+                image.size,
+                preprocessor.get_options(),
+            )
+            return future.result()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def to_data_url(self, image, preprocessor):
+        """Encode an image in a worker process as a base64 data URL
+
+        Args:
+            image: PIL Image object
+            preprocessor: ImagePreprocessor holding the encoding options
+
+        Returns:
+            tuple: (data URL, metadata dict)
+        """
+        encoded, metadata = self.encode(image, preprocessor)
+        base64_string = base64.b64encode(encoded).decode("utf-8")
+        return f"data:{preprocessor.mime_type};base64,{base64_string}", metadata
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self._executor.shutdown(cancel_futures=True)
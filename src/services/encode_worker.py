@@ -0,0 +1,38 @@
+"""
+Worker-side entry point of the encoding process pool.
+
+Kept free of UI and logging imports so spawned worker processes start quickly.
+"""
+
+from multiprocessing import shared_memory
+from PIL import Image
+from src.services.image_preprocessor import ImagePreprocessor
+
+
+def encode_shared_image(shm_name, mode, size, options):
+    """Encode an image whose raw pixels live in a shared memory block
+
+    Args:
+        shm_name (str): Name of the shared memory block holding the pixels
+        mode (str): PIL image mode of the pixels
+        size (tuple): (width, height) of the image
+        options (dict): Keyword arguments for ImagePreprocessor
+
+    Returns:
+        tuple: (encoded bytes, metadata dict)
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        image = Image.frombuffer(mode, size, shm.buf, "raw", mode, 0, 1)
+        try:
+            return ImagePreprocessor(**options).encode(image)
+        finally:
+            # Release the buffer export before the block is closed
+            del image
+    finally:
+        shm.close()
+
+
+def ping():
+    """No-op task used to start the worker processes ahead of time"""
+    return True
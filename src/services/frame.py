@@ -0,0 +1,190 @@
+"""
+Shared, reference-counted screenshot frame used across the capture path.
+"""
+
+import threading
+import weakref
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+# Bytes per pixel of PIL's internal storage; 3-band modes are padded to 4
+_BYTES_PER_PIXEL = {"1": 1, "L": 1, "P": 1, "RGB": 4, "RGBA": 4, "RGBX": 4}
+
+
+def image_nbytes(image):
+    """Approximate memory held by a PIL image's pixel buffer
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        int: Size in bytes
+    """
+    bytes_per_pixel = _BYTES_PER_PIXEL.get(image.mode, len(image.getbands()))
+    return image.width * image.height * bytes_per_pixel
+
+
+class Frame:
+    """One captured screenshot referenced by every component instead of copied
+
+    The pixels must be treated as read-only: every transformation (crop,
+    resize, convert) returns a new image. Holders call acquire() and
+    release(); the buffer is dropped as soon as the last holder releases it.
+    """
+
+    _live_frames = weakref.WeakSet()
+    _next_id = 1
+    _id_lock = threading.Lock()
+
+    def __init__(self, image, source="capture"):
+        """
+        Wrap a captured image. The creator holds the first reference.
+
+        Args:
+            image: PIL Image object, owned by the frame from now on
+            source (str): Where the frame came from, used in the memory report
+        """
+        with Frame._id_lock:
+            self.frame_id = Frame._next_id
+            Frame._next_id += 1
+        self.source = source
+        self.size = image.size
+        self._image = image
+        self._pyramid = None
+        self._refs = 1
+        self._lock = threading.Lock()
+        Frame._live_frames.add(self)
+
+    @property
+    def image(self):
+        """The shared PIL image. Do not modify it in place."""
+        image = self._image
+        if image is None:
+            raise RuntimeError(f"Frame {self.frame_id} has already been released")
+        return image
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @property
+    def released(self):
+        """Whether the pixel buffer has been dropped"""
+        return self._image is None
+
+    @property
+    def nbytes(self):
+        """Memory held by the frame's pixel buffer and its pyramid"""
+        image = self._image
+        if image is None:
+            return 0
+        levels = self._pyramid or ()
+        return image_nbytes(image) + sum(image_nbytes(level) for level in levels)
+
+    def build_pyramid(self, min_size=None):
+        """Precompute successively halved copies of the image
+
+        Safe to call from a worker thread; does nothing if already built.
+
+        Args:
+            min_size (int): Stop once the longest side would drop below this
+        """
+        min_size = min_size or Settings.PREVIEW_PYRAMID_MIN_SIZE
+        if self._pyramid is not None or self._image is None:
+            return
+
+        levels = []
+        level = self.image
+        while max(level.size) // 2 >= min_size:
+            level = level.reduce(2)
+            levels.append(level)
+
+        with self._lock:
+            if self._image is not None:
+                self._pyramid = levels
+        logger.debug(f"Frame {self.frame_id} pyramid built with {len(levels)} levels")
+
+    def nearest_level(self, width, height):
+        """Return the smallest pyramid level that still covers a target size
+
+        Falls back to the full-resolution image when the pyramid is not
+        built yet or the target is larger than every level.
+
+        Args:
+            width (int): Target width
+            height (int): Target height
+
+        Returns:
+            PIL Image object to resample from
+        """
+        best = self.image
+        for level in self._pyramid or ():
+            if level.width < width or level.height < height:
+                break
+            best = level
+        return best
+
+    def acquire(self):
+        """Take a reference to the frame
+
+        Returns:
+            Frame: self, for chaining
+        """
+        with self._lock:
+            if self._image is None:
+                raise RuntimeError(f"Frame {self.frame_id} has already been released")
+            self._refs += 1
+        return self
+
+    def release(self):
+        """Drop a reference; the pixels are freed with the last one"""
+        with self._lock:
+            if self._image is None:
+                return
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            self._image = None
+            self._pyramid = None
+        logger.debug(f"Frame {self.frame_id} released")
+
+    @classmethod
+    def memory_report(cls):
+        """Summarize the frames that still hold pixels
+
+        Returns:
+            dict: Number of live frames, total bytes and per-frame details
+        """
+        frames = [frame for frame in list(cls._live_frames) if not frame.released]
+        details = [
+            {
+                "id": frame.frame_id,
+                "source": frame.source,
+                "size": list(frame.size),
+                "refs": frame._refs,
+                "bytes": frame.nbytes,
+            }
+            for frame in frames
+        ]
+        return {
+            "frames": len(details),
+            "total_bytes": sum(detail["bytes"] for detail in details),
+            "details": details,
+        }
+
+    @classmethod
+    def log_memory_report(cls):
+        """Log the memory report at debug level"""
+        report = cls.memory_report()
+        logger.debug(
+            f"Live frames: {report['frames']}, "
+            f"{report['total_bytes'] / (1024 * 1024):.1f} MiB"
+        )
+        for detail in report["details"]:
+            logger.debug(f"  {detail}")
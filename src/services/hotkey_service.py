@@ -0,0 +1,71 @@
+"""
+System-wide hotkey registration for the capture-and-analyze fast path.
+"""
+
+import time
+import keyboard
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class HotkeyService:
+    """Registers one global hotkey with the keyboard module
+
+    The callback runs on the keyboard listener thread and receives the
+    time.perf_counter() timestamp of the key press; callers hand it over
+    to the Tk main loop themselves.
+    """
+
+    def __init__(self, hotkey, callback):
+        """
+        Initialize the service without registering anything yet.
+
+        Args:
+            hotkey (str): Key combination in keyboard's syntax, e.g. "ctrl+shift+x"
+            callback: Called with the key press timestamp
+        """
+        self.hotkey = hotkey
+        self.callback = callback
+        self._handle = None
+
+    @property
+    def active(self):
+        """Whether the hotkey is currently registered"""
+        return self._handle is not None
+
+    def start(self):
+        """Register the hotkey
+
+        Returns:
+            bool: True if the hotkey is registered
+        """
+        if self._handle is not None:
+            return True
+        try:
+            self._handle = keyboard.add_hotkey(self.hotkey, self._on_hotkey)
+        except Exception as e:
+            # Invalid combination, or the platform needs extra privileges
+            logger.warning(f"Could not register hotkey '{self.hotkey}': {str(e)}")
+            return False
+        logger.info(f"Global hotkey registered: {self.hotkey}")
+        return True
+
+    def stop(self):
+        """Unregister the hotkey if it is registered"""
+        if self._handle is None:
+            return
+        try:
+            keyboard.remove_hotkey(self._handle)
+        except (KeyError, ValueError):
+            pass
+        self._handle = None
+        logger.info(f"Global hotkey removed: {self.hotkey}")
+
+    def _on_hotkey(self):
+        """Runs on the keyboard listener thread"""
+        pressed_at = time.perf_counter()
+        try:
+            self.callback(pressed_at)
+        except Exception as e:
+            logger.error(f"Hotkey callback failed: {str(e)}")
@@ -0,0 +1,172 @@
+"""
+Preprocessing and encoding of screenshots before they are uploaded.
+"""
+
+import base64
+from io import BytesIO
+from PIL import Image
+from src.settings.settings import Settings
+from src.services.auto_crop import AutoCropper
+
+# Supported output formats and their MIME types
+FORMAT_MIME_TYPES = {
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+}
+
+COLOR_MODES = ("rgb", "grayscale", "palette")
+
+
+class ImagePreprocessor:
+    """Downscales, reduces colors and encodes an image for upload"""
+
+    def __init__(
+        self,
+        max_dimension=None,
+        color_mode=None,
+        image_format=None,
+        png_compress_level=None,
+        quality=None,
+        palette_colors=None,
+        auto_crop=None,
+    ):
+        """
+        Initialize the preprocessor. Unset options fall back to the settings.
+
+        Args:
+            max_dimension (int): Longest side in pixels after downscaling, 0 to disable
+            color_mode (str): "rgb", "grayscale" or "palette"
+            image_format (str): "PNG", "WEBP" or "JPEG"
+            png_compress_level (int): zlib level 0-9 for PNG output
+            quality (int): Quality 1-100 for WebP and JPEG output
+            palette_colors (int): Number of colors for palette quantization
+            auto_crop (bool): Trim empty borders around the content first
+        """
+        self.max_dimension = (
+            Settings.PAYLOAD_MAX_DIMENSION if max_dimension is None else max_dimension
+        )
+        self.color_mode = color_mode or Settings.PAYLOAD_COLOR_MODE
+        self.image_format = (image_format or Settings.PAYLOAD_FORMAT).upper()
+        self.png_compress_level = (
+            Settings.PAYLOAD_PNG_COMPRESS_LEVEL
+            if png_compress_level is None
+            else png_compress_level
+        )
+        self.quality = quality or Settings.PAYLOAD_QUALITY
+        self.palette_colors = palette_colors or Settings.PAYLOAD_PALETTE_COLORS
+        if auto_crop is None:
+            auto_crop = Settings.AUTO_CROP_ENABLED
+        self.cropper = AutoCropper() if auto_crop else None
+
+        if self.image_format not in FORMAT_MIME_TYPES:
+            raise ValueError(f"Unsupported payload format '{self.image_format}'")
+        if self.color_mode not in COLOR_MODES:
+            raise ValueError(f"Unsupported color mode '{self.color_mode}'")
+
+    def get_options(self):
+        """Return the options as keyword arguments for a new preprocessor
+
+        Returns:
+            dict: Picklable options, e.g. for encoding in another process
+        """
+        return {
+            "max_dimension": self.max_dimension,
+            "color_mode": self.color_mode,
+            "image_format": self.image_format,
+            "png_compress_level": self.png_compress_level,
+            "quality": self.quality,
+            "palette_colors": self.palette_colors,
+            "auto_crop": self.cropper is not None,
+        }
+
+    @property
+    def mime_type(self):
+        """MIME type of the encoded output"""
+        return FORMAT_MIME_TYPES[self.image_format]
+
+    @property
+    def extension(self):
+        """File extension matching the encoded output"""
+        return "jpg" if self.image_format == "JPEG" else self.image_format.lower()
+
+    def describe(self):
+        """Short human readable summary of the options"""
+        if self.image_format == "PNG":
+            detail = f"level={self.png_compress_level}"
+        else:
+            detail = f"quality={self.quality}"
+        crop = " crop" if self.cropper else ""
+        return (
+            f"{self.image_format} {self.color_mode} "
+            f"max={self.max_dimension or 'full'} {detail}{crop}"
+        )
+
+    def process(self, image):
+        """Apply cropping, downscaling and color reduction
+
+        Args:
+            image: PIL Image object, left untouched
+
+        Returns:
+            tuple: (PIL Image object ready to encode, metadata dict describing
+            the original size, crop box and scale)
+        """
+        metadata = {"original_size": [image.width, image.height]}
+
+        if self.cropper:
+            image, crop_metadata = self.cropper.crop(image)
+            metadata.update(crop_metadata)
+
+        if self.max_dimension and max(image.size) > self.max_dimension:
+            scale = self.max_dimension / max(image.size)
+            new_size = (
+                max(1, round(image.width * scale)),
+                max(1, round(image.height * scale)),
+            )
+            image = image.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            metadata["scale"] = round(scale, 4)
+
+        if self.color_mode == "grayscale":
+            image = image.convert("L")
+        elif self.color_mode == "palette" and self.image_format == "PNG":
+            # Only PNG keeps a palette; the other formats fall back to RGB
+            image = image.convert("RGB").quantize(colors=self.palette_colors)
+        elif image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        metadata["size"] = [image.width, image.height]
+        return image, metadata
+
+    def encode(self, image):
+        """Process and encode an image
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            tuple: (encoded bytes, metadata dict from process)
+        """
+        image, metadata = self.process(image)
+
+        buffer = BytesIO()
+        if self.image_format == "PNG":
+            image.save(buffer, format="PNG", compress_level=self.png_compress_level)
+        elif self.image_format == "WEBP":
+            image.save(buffer, format="WEBP", quality=self.quality, method=4)
+        else:
+            image.save(buffer, format="JPEG", quality=self.quality, optimize=True)
+        return buffer.getvalue(), metadata
+
+    def to_data_url(self, image):
+        """Encode an image as a base64 data URL
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            tuple: (data URL such as 'data:image/png;base64,...', metadata dict)
+        """
+        encoded, metadata = self.encode(image)
+        base64_string = base64.b64encode(encoded).decode("utf-8")
+        return f"data:{self.mime_type};base64,{base64_string}", metadata
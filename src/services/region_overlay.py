@@ -0,0 +1,224 @@
+"""
+Reusable fullscreen overlay for selecting a screen region.
+"""
+
+import tkinter as tk
+import keyboard
+from PIL import Image, ImageTk
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+# Smallest drag, in pixels along each axis, that counts as a selection
+MIN_SELECTION_SIZE = 10
+
+
+class RegionOverlay:
+    """Fullscreen selection overlay that is built once and only shown or hidden
+
+    Creating the Toplevel, canvas, label and cancel button on every click
+    costs several frames; the overlay keeps them alive between selections
+    and only swaps the background and resets the selection rectangle.
+    """
+
+    def __init__(self, root):
+        """
+        Create the overlay hidden.
+
+        Args:
+            root: The root Tk window
+        """
+        self.window = tk.Toplevel(root)
+        self.window.withdraw()
+        # Borderless and placed explicitly, so it can cover any one display
+        self.window.overrideredirect(True)
+        self.window.attributes("-topmost", True)
+        self.window.configure(bg="gray")
+
+        # Create a canvas for drawing the selection rectangle
+        self.canvas = tk.Canvas(self.window, bg="gray", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._background_item = self.canvas.create_image(0, 0, anchor="nw")
+        self._background_photo = None
+        self._selection_rect = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="red", width=2, state="hidden"
+        )
+
+        # Create status label with clear instructions
+        instructions = tk.Label(
+            self.window,
+            text="Click and drag to select a region. Press ESC to cancel.",
+            bg="black",
+            fg="white",
+            font=("Arial", 12),
+        )
+        instructions.place(x=10, y=10)
+
+        # Create a large, prominent cancel button
+        cancel_btn = tk.Button(
+            self.window,
+            text="CANCEL (ESC)",
+            command=self.cancel,
+            bg="red",
+            fg="white",
+            font=("Arial", 12, "bold"),
+            padx=10,
+            pady=5,
+            relief=tk.RAISED,
+            bd=3,
+        )
+        cancel_btn.place(x=10, y=50)
+
+        self._start = None
+        self._result = None
+        self._geometry = None
+        self._done = tk.IntVar(self.window, value=0)
+        self._escape_hook = None
+
+        # Register the event handlers
+        self.canvas.bind("<ButtonPress-1>", self._on_mouse_down)
+        self.canvas.bind("<B1-Motion>", self._on_mouse_move)
+        self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
+        self.window.bind("<Escape>", lambda event: self.cancel())
+
+    @property
+    def size(self):
+        """(width, height) the overlay covers, in Tk pixels"""
+        if self._geometry is None:
+            return self.window.winfo_screenwidth(), self.window.winfo_screenheight()
+        return self._geometry[2:]
+
+    @property
+    def visible(self):
+        """Whether the overlay is currently shown"""
+        return self.window.winfo_viewable()
+
+    def show(self, background=None, geometry=None):
+        """Map the overlay over one display.
+
+        Args:
+            background: Optional PIL Image shown opaque behind the selection;
+                without one the overlay is semi-transparent over the live screen
+            geometry: (x, y, width, height) to cover in Tk pixels; defaults
+                to the primary screen
+        """
+        self._geometry = geometry
+        screen_width, screen_height = self.size
+        x, y = geometry[:2] if geometry is not None else (0, 0)
+        if background is not None:
+            if background.size != (screen_width, screen_height):
+                background = background.resize(
+                    (screen_width, screen_height), Image.Resampling.BILINEAR
+                )
+            self._background_photo = ImageTk.PhotoImage(background, master=self.window)
+            self.canvas.itemconfigure(
+                self._background_item, image=self._background_photo
+            )
+            self.window.attributes("-alpha", 1.0)
+        else:
+            self.window.attributes("-alpha", 0.3)  # Semi-transparent
+
+        self._start = None
+        self._result = None
+        self.canvas.itemconfigure(self._selection_rect, state="hidden")
+        self.window.geometry(f"{screen_width}x{screen_height}+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        self._add_escape_hook()
+
+    def hide(self):
+        """Unmap the overlay and drop the background image."""
+        self._remove_escape_hook()
+        self.window.withdraw()
+        self.canvas.itemconfigure(self._background_item, image="")
+        self._background_photo = None
+
+    def select(self, background=None, geometry=None):
+        """Show the overlay and wait until a region is selected or cancelled.
+
+        Tk events keep being processed while waiting.
+
+        Args:
+            background: Optional frozen frame, see show()
+            geometry: Area to cover, see show()
+
+        Returns:
+            tuple: (left, top, right, bottom) in Tk pixels relative to the
+            overlay's top-left corner, or None if cancelled
+        """
+        self.show(background, geometry)
+        try:
+            self.window.wait_variable(self._done)
+        finally:
+            self.hide()
+        return self._result
+
+    def cancel(self):
+        """End the current selection without a region."""
+        self._finish(None)
+
+    def _add_escape_hook(self):
+        """Also catch ESC system-wide, in case the overlay did not get focus.
+
+        The <Escape> binding covers the usual case; the hook only exists
+        while the overlay is shown.
+        """
+        if not Settings.REGION_GLOBAL_ESC_HOOK or self._escape_hook is not None:
+            return
+        try:
+            self._escape_hook = keyboard.on_press_key(
+                "esc", self._on_global_escape, suppress=False
+            )
+        except Exception as e:
+            # The keyboard module needs extra privileges on some platforms
+            logger.warning(f"Global ESC hook unavailable: {e}")
+
+    def _remove_escape_hook(self):
+        if self._escape_hook is None:
+            return
+        try:
+            keyboard.unhook(self._escape_hook)
+        except (KeyError, ValueError):
+            pass
+        self._escape_hook = None
+
+    def _on_global_escape(self, event):
+        """Runs on the keyboard listener thread; schedule the cancel on Tk's."""
+        logger.info("ESC key detected by keyboard hook")
+        self.window.after(0, self.cancel)
+
+    def _finish(self, result):
+        self._result = result
+        self._done.set(self._done.get() + 1)
+
+    def _on_mouse_down(self, event):
+        self._start = (event.x, event.y)
+        self.canvas.coords(self._selection_rect, event.x, event.y, event.x, event.y)
+        self.canvas.itemconfigure(self._selection_rect, state="normal")
+
+    def _on_mouse_move(self, event):
+        if self._start is None:
+            return
+        start_x, start_y = self._start
+        self.canvas.coords(self._selection_rect, start_x, start_y, event.x, event.y)
+
+    def _on_mouse_up(self, event):
+        if self._start is None:
+            return
+        start_x, start_y = self._start
+        # Only consider it a valid selection if drag distance is significant
+        if (
+            abs(event.x - start_x) > MIN_SELECTION_SIZE
+            and abs(event.y - start_y) > MIN_SELECTION_SIZE
+        ):
+            # Normalize coordinates (start < end)
+            self._finish(
+                (
+                    min(start_x, event.x),
+                    min(start_y, event.y),
+                    max(start_x, event.x),
+                    max(start_y, event.y),
+                )
+            )
@@ -0,0 +1,246 @@
+"""
+Typed model of analysis responses, decoded once from the API body.
+"""
+
+import json
+import hashlib
+from dataclasses import dataclass, field
+from src.settings.settings import Settings
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding and encoding
+    orjson = None
+
+
+def loads(data):
+    """Decode JSON from bytes or str, using orjson when it is installed
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode an object as UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def body_digest(body):
+    """Summarize a response body for the log without writing all of it
+
+    Args:
+        body (bytes): The raw body
+
+    Returns:
+        str: Size, content hash and the first Settings.LOG_BODY_PREVIEW bytes
+    """
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    preview = body[: Settings.LOG_BODY_PREVIEW].decode("utf-8", "replace")
+    ellipsis = "..." if len(body) > Settings.LOG_BODY_PREVIEW else ""
+    return f"{len(body)} bytes, blake2b {digest}: {preview!r}{ellipsis}"
+
+
+def _text(value, default="N/A"):
+    if value is None:
+        return default
+    return value if isinstance(value, str) else str(value)
+
+
+@dataclass(slots=True, frozen=True)
+class Choice:
+    """One answer choice of a question"""
+
+    id: str
+    text: str
+    correct: bool
+    # The choice as sent by the API, kept so the response can be stored again
+    raw: str
+
+    @classmethod
+    def from_raw(cls, raw, position, correct):
+        """Split a choice like "2. Some answer" into its id and text
+
+        Args:
+            raw (str): Choice text from the API
+            position (int): Zero-based position, used for a letter id if raw has none
+            correct (bool): Whether the choice is marked correct
+        """
+        raw = _text(raw, "")
+        stripped = raw.strip()
+        if stripped and stripped[0].isdigit() and ". " in raw:
+            choice_id, text = raw.split(". ", 1)
+            return cls(choice_id.strip(), text.strip(), correct, raw)
+        choice_id = chr(65 + position) if position < 26 else str(position + 1)
+        return cls(choice_id, raw, correct, raw)
+
+    @property
+    def label(self):
+        """The choice as displayed, with its id unless the text already has it"""
+        if self.id in self.text:
+            return self.text
+        return f"{self.id}. {self.text}"
+
+
+@dataclass(slots=True, frozen=True)
+class Confidence:
+    """Confidence reported for a question, e.g. "85%" """
+
+    raw: object
+    # Parsed percentage, None if the API sent something else
+    percent: int = None
+
+    @classmethod
+    def from_raw(cls, raw):
+        percent = None
+        if isinstance(raw, str) and "%" in raw:
+            try:
+                percent = int(raw.strip("%"))
+            except ValueError:
+                pass
+        return cls("N/A" if raw is None else raw, percent)
+
+    @property
+    def level(self):
+        """ "high", "medium" or "low", or None without a percentage"""
+        if self.percent is None:
+            return None
+        if self.percent >= 80:
+            return "high"
+        if self.percent >= 50:
+            return "medium"
+        return "low"
+
+    @property
+    def meter(self):
+        """Five-cell bar for the percentage"""
+        filled = min(5, max(0, (self.percent or 0) // 20))
+        return "█" * filled + "░" * (5 - filled)
+
+
+@dataclass(slots=True, frozen=True)
+class Question:
+    """One analyzed question with its choices, explanation and confidence"""
+
+    number: str
+    text: str
+    question_type: str
+    choices: tuple
+    reason: str
+    confidence: Confidence
+
+    @classmethod
+    def from_dict(cls, data, idx):
+        """Validate and convert one question of the API response
+
+        Args:
+            data (dict): The question as sent by the API
+            idx (int): Zero-based position, used for a number if data has none
+
+        Raises:
+            ValueError: If the question is not an object
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Question {idx + 1} is not an object")
+        answer_raw = data.get("answer_raw") or []
+        correct = data.get("answer") or []
+        if not isinstance(answer_raw, list) or not isinstance(correct, list):
+            raise ValueError(f"Question {idx + 1} has malformed choices")
+
+        return cls(
+            number=_text(data.get("number"), f"Q{idx+1}"),
+            text=_text(data.get("question_raw")),
+            question_type=_text(data.get("type_question")),
+            choices=tuple(
+                Choice.from_raw(raw, i, i < len(correct) and bool(correct[i]))
+                for i, raw in enumerate(answer_raw)
+            ),
+            reason=_text(data.get("reason")),
+            confidence=Confidence.from_raw(data.get("accuracy")),
+        )
+
+    @property
+    def single_choice(self):
+        return self.question_type == "single-choice"
+
+    def to_dict(self):
+        """Return the question in the API's JSON shape"""
+        return {
+            "number": self.number,
+            "question_raw": self.text,
+            "answer_raw": [choice.raw for choice in self.choices],
+            "answer": [choice.correct for choice in self.choices],
+            "reason": self.reason,
+            "type_question": self.question_type,
+            "accuracy": self.confidence.raw,
+        }
+
+
+@dataclass(slots=True)
+class AnalysisResponse:
+    """Decoded analysis response: its questions, or the error the API reported"""
+
+    questions: list = field(default_factory=list)
+    error: str = None
+
+    @classmethod
+    def failure(cls, message):
+        return cls(error=message)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate and convert a decoded response
+
+        A body without a "data" list becomes a failed response instead of
+        raising, so callers can show it like any other error.
+
+        Args:
+            data (dict): {"data": [questions]} or {"error": message}
+
+        Raises:
+            ValueError: If a question is malformed
+        """
+        if not isinstance(data, dict):
+            return cls.failure("Invalid API response format")
+        if "error" in data:
+            return cls.failure(_text(data["error"]))
+        questions = data.get("data")
+        if not isinstance(questions, list):
+            return cls.failure("Invalid API response format")
+        return cls(
+            [
+                Question.from_dict(question, idx)
+                for idx, question in enumerate(questions)
+            ]
+        )
+
+    @classmethod
+    def from_json(cls, body):
+        """Decode and validate a response body in one pass
+
+        Args:
+            body (bytes | str): The raw body
+
+        Raises:
+            ValueError: If the body is not valid JSON or a question is malformed
+        """
+        return cls.from_dict(loads(body))
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def to_dict(self):
+        """Return the response in the API's JSON shape"""
+        if self.error is not None:
+            return {"error": self.error}
+        return {"data": [question.to_dict() for question in self.questions]}
+
+    def to_json(self):
+        """Encode the response as UTF-8 JSON bytes for storage"""
+        return dumps(self.to_dict())
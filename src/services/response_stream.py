@@ -0,0 +1,123 @@
+"""
+Incremental decoding of streamed analysis responses.
+"""
+
+from src.utils.logger import get_logger
+from src.services.response_model import AnalysisResponse, Question, loads
+
+logger = get_logger()
+
+# Sent when the caller can use streamed questions; plain JSON stays acceptable
+STREAM_ACCEPT = "application/x-ndjson, text/event-stream;q=0.9, application/json;q=0.8"
+
+_NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+_SSE_TYPE = "text/event-stream"
+
+
+def stream_format(content_type):
+    """Return the streaming format of a response from its Content-Type
+
+    Args:
+        content_type (str): Value of the Content-Type header, may be None
+
+    Returns:
+        str: "ndjson" or "sse", or None for a single JSON body
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in _NDJSON_TYPES:
+        return "ndjson"
+    if media_type == _SSE_TYPE:
+        return "sse"
+    return None
+
+
+class StreamDecoder:
+    """Turns the lines of an NDJSON or SSE body into questions as they arrive
+
+    Each NDJSON line, or the data of each SSE event, holds one question
+    object. An event with an "error" key ends the analysis with that error,
+    and an event with a "data" list is taken as a batch of questions, so a
+    server may also stream the regular response shape. "[DONE]" and empty
+    events are ignored.
+    """
+
+    def __init__(self, stream_format, on_question=None):
+        """
+        Initialize the decoder.
+
+        Args:
+            stream_format (str): "ndjson" or "sse", as returned by stream_format()
+            on_question: Called with each Question as soon as it is decoded
+        """
+        self.stream_format = stream_format
+        self.on_question = on_question
+        self.questions = []
+        self.error = None
+        # Data lines of the SSE event being read
+        self._event_data = []
+
+    def feed_line(self, line):
+        """Decode one line of the body
+
+        Args:
+            line (bytes | str): The line, with or without its line ending
+        """
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r\n")
+
+        if self.stream_format == "sse":
+            self._feed_sse_line(line)
+        else:
+            self._feed_event(line)
+
+    def finish(self):
+        """Decode what is left and return the complete response
+
+        Returns:
+            AnalysisResponse: The same response a non-streamed body decodes to
+        """
+        self._dispatch_sse_event()
+        if self.error is not None:
+            return AnalysisResponse.failure(self.error)
+        return AnalysisResponse(self.questions)
+
+    def _feed_sse_line(self, line):
+        if not line:
+            # A blank line ends the event
+            self._dispatch_sse_event()
+            return
+        if line.startswith(":"):
+            # Comment, usually a keep-alive
+            return
+        field, _, value = line.partition(":")
+        if field == "data":
+            self._event_data.append(value[1:] if value.startswith(" ") else value)
+
+    def _dispatch_sse_event(self):
+        if self._event_data:
+            data = "\n".join(self._event_data)
+            self._event_data = []
+            self._feed_event(data)
+
+    def _feed_event(self, text):
+        """Decode the JSON of one event"""
+        text = text.strip()
+        if not text or text == "[DONE]":
+            return
+
+        event = loads(text)
+        if isinstance(event, dict) and "error" in event:
+            logger.error(f"Streamed response reported an error: {event['error']}")
+            self.error = str(event["error"])
+        elif isinstance(event, dict) and isinstance(event.get("data"), list):
+            for question in event["data"]:
+                self._add_question(question)
+        else:
+            self._add_question(event)
+
+    def _add_question(self, data):
+        question = Question.from_dict(data, len(self.questions))
+        self.questions.append(question)
+        if self.on_question is not None:
+            self.on_question(question)
@@ -0,0 +1,195 @@
+"""
+Result cache keyed by a content digest of the analyzed screenshot.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.services.response_model import AnalysisResponse
+
+logger = get_logger()
+
+
+def content_digest(image, thumbnail_size=None):
+    """Hash the content of an image for an exact cache match
+
+    The image is shrunk to a grayscale thumbnail whose longest side is
+    thumbnail_size pixels and the thumbnail is hashed together with the
+    image size. Two screenshots only share a digest if their thumbnails are
+    identical, so a different question on the same page layout never
+    matches the previous one.
+
+    Args:
+        image: PIL Image object
+        thumbnail_size (int): Longest side of the thumbnail in pixels
+
+    Returns:
+        bytes: The digest
+    """
+    thumbnail_size = thumbnail_size or Settings.RESULT_CACHE_THUMBNAIL_SIZE
+    scale = min(1.0, thumbnail_size / max(image.size))
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    small = image.resize(size, Image.Resampling.BOX, reducing_gap=2.0).convert("L")
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.width}x{image.height}:{small.width}x{small.height}".encode())
+    digest.update(small.tobytes())
+    return digest.digest()
+
+
+class ResultCache:
+    """Bounded LRU cache of API responses with an optional on-disk tier"""
+
+    def __init__(self, max_entries=None, disk_enabled=None, disk_dir=None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of responses kept in memory
+            disk_enabled (bool): Whether responses are also persisted to disk
+            disk_dir (str): Directory for the on-disk tier
+        """
+        self.max_entries = max_entries or Settings.RESULT_CACHE_MAX_ENTRIES
+        if disk_enabled is None:
+            disk_enabled = Settings.RESULT_CACHE_DISK_ENABLED
+
+        # Key -> response, most recently used last
+        self._entries = OrderedDict()
+        # Key -> file path of the persisted response
+        self._disk_index = {}
+        self._lock = threading.Lock()
+
+        self.disk_dir = None
+        if disk_enabled:
+            if disk_dir is None:
+                app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                disk_dir = os.path.join(app_root, "cache")
+            self.disk_dir = disk_dir
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    def make_key(self, content, api_url, options):
+        """Build the cache key of an analysis
+
+        The same screenshot sent to another API, or preprocessed with other
+        options, is a different request and gets a different key.
+
+        Args:
+            content (bytes): content_digest of the screenshot
+            api_url (str): URL the screenshot is sent to
+            options (dict): Preprocessing options of the upload
+
+        Returns:
+            str: The key as a hex digest
+        """
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(api_url.encode("utf-8"))
+        digest.update(repr(sorted(options.items())).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Look up the response stored for a key
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            AnalysisResponse: The cached response, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+            path = self._disk_index.get(key)
+            if path is None:
+                return None
+
+        try:
+            with open(path, "rb") as f:
+                response = AnalysisResponse.from_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {str(e)}")
+            with self._lock:
+                self._disk_index.pop(key, None)
+            return None
+
+        with self._lock:
+            self._remember(key, response)
+        return response
+
+    def put(self, key, response):
+        """Store a response for a key
+
+        Args:
+            key: Key returned by make_key
+            response (AnalysisResponse): The API response to cache
+        """
+        with self._lock:
+            self._remember(key, response)
+
+        if self.disk_dir:
+            self._write_to_disk(key, response)
+
+    def _remember(self, key, response):
+        """Insert into the in-memory tier and evict the least recently used"""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _file_name(self, key):
+        """Encode a key as a file name"""
+        return f"{key}.json"
+
+    def _load_disk_index(self):
+        """Rebuild the key index from the files in the cache directory"""
+        for name in os.listdir(self.disk_dir):
+            key, ext = os.path.splitext(name)
+            # Files of other key formats never match and are skipped
+            if ext != ".json" or len(key) != 32:
+                continue
+            try:
+                int(key, 16)
+            except ValueError:
+                continue
+            self._disk_index[key] = os.path.join(self.disk_dir, name)
+        logger.info(f"Result cache loaded {len(self._disk_index)} entries from disk")
+
+    def _write_to_disk(self, key, response):
+        """Persist a response and evict the oldest files past the limit"""
+        path = os.path.join(self.disk_dir, self._file_name(key))
+        try:
+            with open(path, "wb") as f:
+                f.write(response.to_json())
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {str(e)}")
+            return
+
+        with self._lock:
+            self._disk_index[key] = path
+            overflow = len(self._disk_index) - Settings.RESULT_CACHE_DISK_MAX_ENTRIES
+            if overflow <= 0:
+                return
+            by_age = sorted(self._disk_index.items(), key=lambda item: _mtime(item[1]))
+            oldest = by_age[:overflow]
+            for old_key, _ in oldest:
+                del self._disk_index[old_key]
+
+        for _, old_path in oldest:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
+def _mtime(path):
+    """Modification time of a file, or 0 if it is gone"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
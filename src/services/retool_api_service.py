@@ -1,10 +1,158 @@
-import json
+import hashlib
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from src.utils.logger import get_logger
 from src.settings.config_manager import ConfigManager
+from src.settings.settings import Settings
+from src.services.response_stream import STREAM_ACCEPT, StreamDecoder, stream_format
+from src.services.response_model import AnalysisResponse, body_digest, dumps
 
 logger = get_logger()
 
+# Process-wide HTTP session so every request reuses pooled keep-alive connections
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+# Worker pool used by submit_request when the threaded backend is selected
+_request_executor = None
+
+# Payload digest -> _SharedRequest of the identical request still in flight
+_in_flight = {}
+# Reentrant: cancelling a shared request runs its done callbacks, which
+# take the lock again to forget the request
+_in_flight_lock = threading.RLock()
+
+
+def get_shared_session():
+    """Return the process-wide pooled HTTP session, creating it on first use
+
+    Returns:
+        requests.Session: Session backed by a bounded keep-alive connection pool
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _create_session()
+    return _shared_session
+
+
+def _create_session():
+    """Build a session with a connection pool sized from the settings"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Settings.HTTP_POOL_MAXSIZE,
+        max_retries=Settings.HTTP_MAX_RETRIES,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = (
+        "keep-alive" if Settings.HTTP_KEEP_ALIVE else "close"
+    )
+    logger.info(
+        f"HTTP session created (pool size: {Settings.HTTP_POOL_MAXSIZE}, "
+        f"keep-alive: {Settings.HTTP_KEEP_ALIVE})"
+    )
+    return session
+
+
+def _get_request_executor():
+    """Return the worker pool for non-blocking requests on the threaded backend"""
+    global _request_executor
+    if _request_executor is None:
+        with _shared_session_lock:
+            if _request_executor is None:
+                _request_executor = ThreadPoolExecutor(
+                    max_workers=Settings.API_MAX_IN_FLIGHT,
+                    thread_name_prefix="RetoolAPI",
+                )
+    return _request_executor
+
+
+class _SharedRequest:
+    """One upload shared by every caller that submitted an identical request
+
+    Each caller gets its own future. Cancelling it only detaches that
+    caller; the upload itself is cancelled once no caller is left. Streamed
+    questions are fanned out to every caller, and a caller that joins late
+    first receives the questions that already arrived.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.future = None
+        self._questions = []
+        self._listeners = []
+        self._waiters = 0
+        self._lock = threading.Lock()
+
+    def on_question(self, question):
+        """Request thread: pass a streamed question on to every caller"""
+        with self._lock:
+            self._questions.append(question)
+            for listener in self._listeners:
+                listener(question)
+
+    def subscribe(self, on_question=None):
+        """Return a future of the shared result for one more caller
+
+        Args:
+            on_question: The caller's streamed question callback, or None
+
+        Returns:
+            concurrent.futures.Future: Resolves like the shared request
+        """
+        waiter = Future()
+        with self._lock:
+            self._waiters += 1
+            if on_question is not None:
+                self._listeners.append(on_question)
+                for question in self._questions:
+                    on_question(question)
+        waiter.add_done_callback(lambda done: self._unsubscribe(done, on_question))
+        self.future.add_done_callback(lambda done: self._resolve(waiter, done))
+        return waiter
+
+    def _resolve(self, waiter, done):
+        if done.cancelled():
+            waiter.cancel()
+            return
+        try:
+            error = done.exception()
+            if error is None:
+                waiter.set_result(done.result())
+            else:
+                waiter.set_exception(error)
+        except InvalidStateError:
+            # The caller cancelled in the meantime
+            pass
+
+    def _unsubscribe(self, waiter, on_question):
+        if not waiter.cancelled():
+            return
+        # Held throughout so no caller can join between the last one leaving
+        # and the upload being cancelled
+        with _in_flight_lock:
+            with self._lock:
+                self._waiters -= 1
+                if on_question is not None:
+                    self._listeners.remove(on_question)
+                abandoned = self._waiters == 0
+            # A request that is already running cannot be cancelled and stays
+            # open to new callers; a cancelled one is forgotten by its callback
+            if abandoned and self.future.cancel():
+                logger.info("Cancelled API request that no caller is waiting for")
+
+
+def _forget_shared_request(shared):
+    with _in_flight_lock:
+        if _in_flight.get(shared.key) is shared:
+            del _in_flight[shared.key]
+
 
 class RetoolAPIService:
     """Service to handle communication with the Retool API"""
@@ -13,8 +161,43 @@ class RetoolAPIService:
         self.config_manager = ConfigManager()
         self.api_url = self.config_manager.api_url
         self.api_key = self.config_manager.api_key
+        self.session = get_shared_session()
+        self.timeout = (Settings.HTTP_CONNECT_TIMEOUT, Settings.HTTP_READ_TIMEOUT)
+
+    def warm_up(self):
+        """Open a pooled connection to the API host in the background
+
+        The TCP and TLS handshakes are paid here at startup, so the first
+        analysis can reuse an already established connection.
+        """
+        if not Settings.HTTP_WARM_UP:
+            return
+        threading.Thread(target=self._warm_up_thread, daemon=True).start()
+
+    def _warm_up_thread(self):
+        """Background thread that sends the warm-up ping"""
+        self._refresh_config()
+        try:
+            self.session.head(
+                self.api_url,
+                timeout=(Settings.HTTP_CONNECT_TIMEOUT, Settings.HTTP_CONNECT_TIMEOUT),
+            )
+            logger.info(f"HTTP connection warmed up for {self.api_url}")
+        except requests.RequestException as e:
+            logger.warning(f"HTTP warm-up failed: {str(e)}")
+
+    def _refresh_config(self):
+        """Update URL and key from config manager in case they've changed"""
+        self.config_manager.reload_if_changed()
+        self.api_url = self.config_manager.api_url
+        self.api_key = self.config_manager.api_key
+
+    def current_api_url(self):
+        """Return the URL requests are sent to, after picking up config changes"""
+        self._refresh_config()
+        return self.api_url
 
-    def send_request(self, user_name, user_id, file_name, image_data):
+    def send_request(self, user_name, user_id, file_name, image_data, metadata=None):
         """
         Send a request to the Retool API
 
@@ -23,14 +206,122 @@ class RetoolAPIService:
             user_id (str): User's ID
             file_name (str): Name of the file being analyzed
             image_data (str): Base64 encoded image data
+            metadata (dict): Optional details about how the image was prepared
 
         Returns:
-            dict: The JSON response from the API or error message
+            AnalysisResponse: The decoded response or error message
         """
-        # Update URL and key from config manager in case they've changed
-        self.api_url = self.config_manager.api_url
-        self.api_key = self.config_manager.api_key
+        self._refresh_config()
+        payload, headers = self._build_request(
+            user_name, user_id, file_name, image_data, metadata
+        )
+        return self._post(payload, headers)
 
+    def submit_request(
+        self,
+        user_name,
+        user_id,
+        file_name,
+        image_data,
+        metadata=None,
+        deadline=None,
+        on_question=None,
+    ):
+        """
+        Send a request to the Retool API without blocking the caller
+
+        The request runs on the backend selected by Settings.API_BACKEND:
+        a shared worker pool ("threaded") or the asyncio client ("asyncio").
+
+        Args:
+            user_name (str): User's name
+            user_id (str): User's ID
+            file_name (str): Name of the file being analyzed
+            image_data (str): Base64 encoded image data
+            metadata (dict): Optional details about how the image was prepared
+            deadline (float): Seconds before the request is abandoned.
+                Defaults to Settings.API_REQUEST_DEADLINE.
+            on_question: Optional callback for streamed responses, called on
+                the request's thread with each Question as it arrives
+
+        Returns:
+            concurrent.futures.Future: Resolves to the AnalysisResponse. A
+            streamed response resolves once its last question has arrived.
+            While a request for the same image is in flight, the caller
+            joins it instead of uploading the image again.
+        """
+        self._refresh_config()
+        if not Settings.API_COALESCE_REQUESTS:
+            return self._start_request(
+                user_name,
+                user_id,
+                file_name,
+                image_data,
+                metadata,
+                deadline,
+                on_question,
+            )
+
+        key = self._request_key(image_data, metadata)
+        with _in_flight_lock:
+            shared = _in_flight.get(key)
+            if shared is not None and not shared.future.done():
+                logger.info(f"Joining identical in-flight request for {file_name}")
+                return shared.subscribe(on_question)
+
+            shared = _SharedRequest(key)
+            shared.future = self._start_request(
+                user_name,
+                user_id,
+                file_name,
+                image_data,
+                metadata,
+                deadline,
+                shared.on_question if on_question is not None else None,
+            )
+            _in_flight[key] = shared
+            waiter = shared.subscribe(on_question)
+        shared.future.add_done_callback(lambda done: _forget_shared_request(shared))
+        return waiter
+
+    def _request_key(self, image_data, metadata):
+        """Digest of everything that determines the answer to a request"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.api_url.encode("utf-8"))
+        digest.update(image_data.encode("ascii"))
+        if metadata:
+            digest.update(dumps(metadata))
+        return digest.digest()
+
+    def _start_request(
+        self, user_name, user_id, file_name, image_data, metadata, deadline, on_question
+    ):
+        """Start a request on the configured backend and return its future"""
+        payload, headers = self._build_request(
+            user_name, user_id, file_name, image_data, metadata
+        )
+        if deadline is None:
+            deadline = Settings.API_REQUEST_DEADLINE
+
+        if on_question is not None and Settings.API_STREAMING:
+            # Offer a streamed response; servers without one still send JSON
+            headers["Accept"] = STREAM_ACCEPT
+        else:
+            on_question = None
+
+        if Settings.API_BACKEND == "asyncio":
+            from src.services.async_api_client import get_async_client
+
+            return get_async_client().submit(
+                self.api_url, payload, headers, deadline, on_question
+            )
+
+        return _get_request_executor().submit(
+            self._post, payload, headers, deadline, on_question
+        )
+
+    def _build_request(self, user_name, user_id, file_name, image_data, metadata):
+        """Build the JSON payload and headers for an analysis request"""
         # Prepare the request data
         payload = {
             "user_name": user_name,
@@ -38,6 +329,9 @@ class RetoolAPIService:
             "file_name": file_name,
             "data": image_data,  # This should include the 'data:image/png;base64,' prefix
         }
+        if metadata:
+            # Crop box and scale so results can be mapped back to the capture
+            payload["metadata"] = metadata
 
         # Set up headers
         headers = {
@@ -46,11 +340,66 @@ class RetoolAPIService:
         }
 
         logger.info(f"Sending API request for file: {file_name}")
+        return payload, headers
 
-        response = requests.post(
-            self.api_url, data=json.dumps(payload), headers=headers
-        )
+    def _post(self, payload, headers, deadline=None, on_question=None):
+        """POST the request through the shared session
+
+        Args:
+            payload (dict): JSON body
+            headers (dict): Request headers
+            deadline (float): Read timeout override in seconds
+            on_question: Called with each question of a streamed response
+
+        Returns:
+            AnalysisResponse: The decoded response or error message
+        """
+        timeout = self.timeout
+        if deadline is not None:
+            timeout = (Settings.HTTP_CONNECT_TIMEOUT, deadline)
+
+        try:
+            response = self.session.post(
+                self.api_url,
+                data=dumps(payload),
+                headers=headers,
+                timeout=timeout,
+                stream=on_question is not None,
+            )
+            if on_question is not None:
+                with response:
+                    streamed = self._read_stream(response, on_question)
+                if streamed is not None:
+                    return streamed
+        except requests.RequestException as e:
+            logger.error(f"API request failed: {str(e)}")
+            return AnalysisResponse.failure(str(e))
+
+        # Decode the body once; only a digest of it goes to the log
+        body = response.content
+        logger.info(f"{response.status_code = }")
+        logger.info(f"Response body: {body_digest(body)}")
+        return AnalysisResponse.from_json(body)
+
+    def _read_stream(self, response, on_question):
+        """Decode a streamed response line by line
+
+        Args:
+            response (requests.Response): Response opened with stream=True
+            on_question: Called with each question as it is decoded
+
+        Returns:
+            AnalysisResponse: The assembled response, or None if the server
+            sent plain JSON; its body is then already loaded into the response
+        """
+        format_name = stream_format(response.headers.get("Content-Type"))
+        if format_name is None:
+            response.content  # Load the JSON body before the response is closed
+            return None
 
-        logger.info(f"{response.json() = }")
+        logger.info(f"Reading {format_name} response stream")
         logger.info(f"{response.status_code = }")
-        return response.json()
+        decoder = StreamDecoder(format_name, on_question)
+        for line in response.iter_lines():
+            decoder.feed_line(line)
+        return decoder.finish()
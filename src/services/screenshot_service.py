@@ -1,13 +1,15 @@
-import os
 import tkinter as tk
-from PIL import ImageGrab
-from datetime import datetime
+from PIL import ImageDraw, ImageGrab
 from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.services.image_preprocessor import ImagePreprocessor
+from src.services.encode_pool import encode_to_data_url
+from src.services.region_overlay import RegionOverlay
+from src.services.change_detector import ChangeDetector
+from src.services.screenshot_writer import get_screenshot_writer
+from src.services.display_service import list_displays, resolve_display, tk_to_pixels
 import time
-import base64
-from io import BytesIO
 import threading
-import keyboard
 
 logger = get_logger()
 
@@ -16,13 +18,21 @@ class ScreenshotService:
     """Service class to handle screenshot functionality"""
 
     def __init__(self):
-        app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.screenshots_dir = os.path.join(app_root, "screenshots")
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        self.writer = get_screenshot_writer()
+        self.screenshots_dir = self.writer.directory
 
         self.image = None
         self.root = None
-        self.exit_selection = False
+        self.region_overlay = None
+        # (display, region in display pixels) of the last region capture
+        self.last_region = None
+
+        # Watch mode state
+        self._watch_thread = None
+        self._watch_stop = None
+        self._watch_displays = []
+        self._watch_window_rect = None
+        self.preprocessor = ImagePreprocessor()
 
     def set_root_window(self, root):
         """Set the root window reference for hiding during screenshots
@@ -31,16 +41,20 @@ class ScreenshotService:
             root: The root Tk window
         """
         self.root = root
+        # Build the selection overlay now so the first click shows it at once
+        self._get_region_overlay()
 
-    def take_screenshot(self, save_to_disk=False):
+    def take_screenshot(self, save_to_disk=False, keep_hidden=False):
         """Capture screenshot of entire screen,
         temporarily hiding the application window to avoid self-capture
 
         Args:
             save_to_disk (bool): Whether to save the screenshot to disk. Defaults to False.
+            keep_hidden (bool): Leave the window hidden after the capture;
+                the caller shows it again. Defaults to False.
 
         Returns:
-            str: Path to the saved screenshot if saved, None otherwise
+            Future: Resolves to the saved screenshot's path if saved, None otherwise
         """
         # Get reference to root window if not already set
         if not self.root:
@@ -52,210 +66,359 @@ class ScreenshotService:
             if not self.root:
                 self.root = tk._default_root
 
-        # Store the current window state
-        was_visible = False
-        if self.root:
-            was_visible = self.root.winfo_viewable()
-            if was_visible:
-                # Hide the window
-                self.root.withdraw()
-                # Allow time for window to be removed from screen
-                time.sleep(0.2)
+        displays = list_displays(self.root)
+        display = resolve_display(Settings.CAPTURE_DISPLAY, self.root, displays)
+
+        was_visible = self._hide_window()
 
         try:
-            # Take screenshot of the entire screen
-            self.image = ImageGrab.grab()
+            # Take screenshot of the chosen display, or of every display
+            self.image = self._grab(display)
+            logger.info(f"Captured {display or 'all displays'}")
+            if Settings.CAPTURE_EXCLUDE_SELF:
+                if display is not None:
+                    origin = (display.left, display.top)
+                else:
+                    origin = (
+                        min((d.left for d in displays), default=0),
+                        min((d.top for d in displays), default=0),
+                    )
+                self._exclude_own_window(self.image, origin, displays)
         finally:
-            # Restore window visibility if it was visible before
-            if self.root and was_visible:
-                self.root.deiconify()
+            if not keep_hidden:
+                self._restore_window(was_visible)
 
         if save_to_disk:
-            return self._save_image("screenshot")
+            return self._save_image()
         return None
 
-    def monitor_escape_key(self, overlay):
-        """Monitor for Escape key press in a separate thread"""
-        while not self.exit_selection:
-            if keyboard.is_pressed("esc"):
-                logger.info("ESC key detected in monitoring thread")
-                # Schedule destroy on main thread
-                overlay.after(0, overlay.destroy)
-                break
-            time.sleep(0.1)
-
-    def take_region_screenshot(self, save_to_disk=False):
+    def _hide_window(self):
+        """Withdraw the root window and wait until it is really off screen
+
+        Waits for the window's <Unmap> event rather than a fixed delay,
+        with a short timeout in case the event never arrives. Tk events
+        keep being processed while waiting.
+
+        Returns:
+            bool: Whether the window was visible and has been hidden
+        """
+        if not self.root or Settings.CAPTURE_EXCLUDE_SELF:
+            return False
+        if not self.root.winfo_viewable():
+            return False
+
+        unmapped = tk.BooleanVar(self.root, value=False)
+
+        def on_unmap(event):
+            if event.widget == self.root:
+                unmapped.set(True)
+
+        # unbind(sequence, funcid) drops every binding of the sequence on
+        # Python 3.11, so the previous script is restored by hand afterwards
+        previous_script = self.root.bind("<Unmap>")
+        binding = self.root.bind("<Unmap>", on_unmap, "+")
+        timeout_job = self.root.after(
+            Settings.WINDOW_HIDE_TIMEOUT_MS, lambda: unmapped.set(True)
+        )
+        start = time.perf_counter()
+        try:
+            self.root.withdraw()
+            # Some window systems unmap synchronously and report it right away
+            if self.root.winfo_ismapped():
+                self.root.wait_variable(unmapped)
+        finally:
+            self.root.after_cancel(timeout_job)
+            self.root.bind("<Unmap>", previous_script)
+            self.root.deletecommand(binding)
+
+        if Settings.WINDOW_HIDE_SETTLE_MS:
+            # Give the compositor one frame to repaint what was behind the window
+            settled = tk.BooleanVar(self.root, value=False)
+            self.root.after(Settings.WINDOW_HIDE_SETTLE_MS, lambda: settled.set(True))
+            self.root.wait_variable(settled)
+
+        logger.debug(f"Window hidden in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return True
+
+    def _restore_window(self, was_visible):
+        """Show the root window again if _hide_window hid it"""
+        if self.root and was_visible:
+            self.root.deiconify()
+
+    def _grab(self, display, bbox=None):
+        """Grab one display, a box on it, or the whole virtual screen
+
+        Args:
+            display: Display to grab, or None for all displays
+            bbox: Optional (left, top, right, bottom) relative to the display
+
+        Returns:
+            PIL Image object
+        """
+        if display is None:
+            return ImageGrab.grab(bbox=bbox, all_screens=True)
+        if bbox is None:
+            return ImageGrab.grab(bbox=display.bbox, all_screens=True)
+        left, top, right, bottom = bbox
+        return ImageGrab.grab(
+            bbox=(
+                display.left + left,
+                display.top + top,
+                display.left + right,
+                display.top + bottom,
+            ),
+            all_screens=True,
+        )
+
+    def _exclude_own_window(self, image, origin, displays):
+        """Blank the app window's area in a capture taken while it was visible
+
+        Args:
+            image: PIL Image captured from the screen, modified in place
+            origin: Virtual-screen pixel position of the image's top-left corner
+            displays: Enumerated displays, to map Tk pixels to screen pixels
+        """
+        self._blank_rect(image, self._own_window_rect(displays), origin)
+
+    def _own_window_rect(self, displays):
+        """Return the app window's area in screen pixels, or None if it is hidden
+
+        Must be called on the Tk main thread.
+
+        Args:
+            displays: Enumerated displays, to map Tk pixels to screen pixels
+        """
+        if not self.root or not self.root.winfo_viewable():
+            return None
+
+        # The frame position includes the title bar, the client area ends the window
+        left = self.root.winfo_x()
+        top = self.root.winfo_y()
+        right = self.root.winfo_rootx() + self.root.winfo_width()
+        bottom = self.root.winfo_rooty() + self.root.winfo_height()
+        return tk_to_pixels(displays, left, top) + tk_to_pixels(displays, right, bottom)
+
+    def _blank_rect(self, image, rect, origin):
+        """Fill a screen rectangle in a captured image
+
+        Args:
+            image: PIL Image captured from the screen, modified in place
+            rect: (left, top, right, bottom) in screen pixels, or None
+            origin: Screen pixel position of the image's top-left corner
+        """
+        if rect is None:
+            return
+        box = [
+            rect[0] - origin[0],
+            rect[1] - origin[1],
+            rect[2] - origin[0],
+            rect[3] - origin[1],
+        ]
+        if (
+            box[2] <= 0
+            or box[3] <= 0
+            or box[0] >= image.width
+            or box[1] >= image.height
+        ):
+            return
+        ImageDraw.Draw(image).rectangle(
+            [box[0], box[1], box[2] - 1, box[3] - 1], fill=Settings.CAPTURE_EXCLUDE_FILL
+        )
+
+    def _get_region_overlay(self):
+        """Return the reusable region selection overlay, creating it on first use"""
+        if self.region_overlay is None:
+            self.region_overlay = RegionOverlay(self.root or tk._default_root)
+        return self.region_overlay
+
+    def take_region_screenshot(self, save_to_disk=False, keep_hidden=False):
         """Capture screenshot of a user-defined region
 
         Args:
             save_to_disk (bool): Whether to save the screenshot to disk. Defaults to False.
+            keep_hidden (bool): Leave the window hidden after a successful
+                capture; the caller shows it again. Defaults to False.
 
         Returns:
-            str: Path to the saved screenshot if saved, None otherwise
+            Future: Resolves to the saved screenshot's path if saved, None otherwise
         """
-        # Reset exit flag
-        self.exit_selection = False
+        # Selection happens on one display; "all" falls back to the one under the cursor
+        displays = list_displays(self.root)
+        choice = Settings.CAPTURE_DISPLAY
+        display = resolve_display(
+            "cursor" if choice == "all" else choice, self.root, displays
+        )
+        # The display's area in Tk pixels, which the overlay covers
+        geometry = display.tk_rect if display is not None else None
 
         # Hide main window temporarily
-        was_visible = False
-        if self.root:
-            was_visible = self.root.winfo_viewable()
-            if was_visible:
-                self.root.withdraw()
-                # Small delay to ensure window is hidden
-                time.sleep(0.2)
+        was_visible = self._hide_window()
 
         try:
-            # Create an overlay window that covers the entire screen
-            overlay = tk.Toplevel()
-            overlay.attributes("-alpha", 0.3)  # Semi-transparent
-            overlay.attributes("-fullscreen", True)
-            overlay.attributes("-topmost", True)
-
-            # Configure overlay appearance
-            overlay.configure(bg="gray")
-
-            # Create a canvas for drawing the selection rectangle
-            canvas = tk.Canvas(overlay, bg="gray", highlightthickness=0)
-            canvas.pack(fill=tk.BOTH, expand=True)
-
-            # Variables to store selection coordinates
-            selection_coords = {"start_x": 0, "start_y": 0, "end_x": 0, "end_y": 0}
-            selection_rect = None
-            selection_made = [False]  # Using a list to make it mutable in closures
-
-            # Create status label with clear instructions
-            instructions = tk.Label(
-                overlay,
-                text="Click and drag to select a region. Press ESC to cancel.",
-                bg="black",
-                fg="white",
-                font=("Arial", 12),
-            )
-            instructions.place(x=10, y=10)
-
-            # Create a large, prominent cancel button
-            cancel_btn = tk.Button(
-                overlay,
-                text="CANCEL (ESC)",
-                command=overlay.destroy,
-                bg="red",
-                fg="white",
-                font=("Arial", 12, "bold"),
-                padx=10,
-                pady=5,
-                relief=tk.RAISED,
-                bd=3,
-            )
-            cancel_btn.place(x=10, y=50)
-
-            # Event handlers for selection
-            def on_mouse_down(event):
-                selection_coords["start_x"] = event.x
-                selection_coords["start_y"] = event.y
-                nonlocal selection_rect
-                if selection_rect:
-                    canvas.delete(selection_rect)
-                selection_rect = canvas.create_rectangle(
-                    event.x, event.y, event.x, event.y, outline="red", width=2
-                )
-
-            def on_mouse_move(event):
-                if selection_rect:
-                    selection_coords["end_x"] = event.x
-                    selection_coords["end_y"] = event.y
-                    canvas.coords(
-                        selection_rect,
-                        selection_coords["start_x"],
-                        selection_coords["start_y"],
-                        event.x,
-                        event.y,
-                    )
-
-            def on_mouse_up(event):
-                selection_coords["end_x"] = event.x
-                selection_coords["end_y"] = event.y
-                # Only consider it a valid selection if drag distance is significant
-                if (
-                    abs(selection_coords["end_x"] - selection_coords["start_x"]) > 10
-                    and abs(selection_coords["end_y"] - selection_coords["start_y"])
-                    > 10
-                ):
-                    selection_made[0] = True
-                    overlay.destroy()
-
-            # Register the event handlers
-            canvas.bind("<ButtonPress-1>", on_mouse_down)
-            canvas.bind("<B1-Motion>", on_mouse_move)
-            canvas.bind("<ButtonRelease-1>", on_mouse_up)
-
-            # Start a background thread to monitor for ESC key
-            monitor_thread = threading.Thread(
-                target=self.monitor_escape_key, args=(overlay,), daemon=True
-            )
-            monitor_thread.start()
+            frozen_frame = None
+            if Settings.REGION_FROZEN_FRAME:
+                # Grab the display once; the selection is cropped from this buffer
+                frozen_frame = self._grab(display)
+                if Settings.CAPTURE_EXCLUDE_SELF:
+                    origin = (display.left, display.top) if display else (0, 0)
+                    self._exclude_own_window(frozen_frame, origin, displays)
 
-            # Wait for overlay to be destroyed (selection complete or cancelled)
-            overlay.wait_window()
+            overlay = self._get_region_overlay()
 
-            # Signal thread to exit
-            self.exit_selection = True
+            # Wait for the selection to complete or be cancelled
+            bbox = overlay.select(background=frozen_frame, geometry=geometry)
 
             # Check if a valid selection was made
-            if not selection_made[0]:
+            if bbox is None:
                 logger.info("Region selection cancelled or invalid")
+                keep_hidden = False
                 return None
 
-            # Normalize coordinates (start < end)
-            left = min(selection_coords["start_x"], selection_coords["end_x"])
-            top = min(selection_coords["start_y"], selection_coords["end_y"])
-            right = max(selection_coords["start_x"], selection_coords["end_x"])
-            bottom = max(selection_coords["start_y"], selection_coords["end_y"])
+            # The overlay reports Tk pixels, captures are in display pixels
+            overlay_width, overlay_height = overlay.size
+            if display is not None:
+                scale_x = display.width / overlay_width
+                scale_y = display.height / overlay_height
+            else:
+                # Without enumerated displays Tk and screen pixels are the same
+                scale_x = scale_y = 1.0
+            region = (
+                round(bbox[0] * scale_x),
+                round(bbox[1] * scale_y),
+                round(bbox[2] * scale_x),
+                round(bbox[3] * scale_y),
+            )
 
-            # Take the screenshot of the selected region
-            self.image = ImageGrab.grab(bbox=(left, top, right, bottom))
-            logger.info(f"Captured region: ({left}, {top}, {right}, {bottom})")
+            self.last_region = (display, region)
+
+            if frozen_frame is not None:
+                # Crop the selection from the frozen frame, no second capture
+                self.image = frozen_frame.crop(region)
+            else:
+                # Take the screenshot of the selected region
+                self.image = self._grab(display, region)
+                if Settings.CAPTURE_EXCLUDE_SELF:
+                    origin = (display.left, display.top) if display else (0, 0)
+                    self._exclude_own_window(
+                        self.image,
+                        (origin[0] + region[0], origin[1] + region[1]),
+                        displays,
+                    )
+            logger.info(f"Captured region {region} on {display or 'the screen'}")
 
             if save_to_disk:
-                return self._save_image("region_screenshot")
+                return self._save_image()
             return None
 
         finally:
             # Restore main window visibility if needed
-            if self.root and was_visible:
-                self.root.deiconify()
-
-    def _save_image(self, prefix):
-        """Save the current image to disk with a timestamp
+            if not keep_hidden:
+                self._restore_window(was_visible)
 
-        Args:
-            prefix: Prefix for the filename
+    def _save_image(self):
+        """Queue the current image to be saved by the background writer
 
         Returns:
-            str: Path to the saved image
+            Future: Resolves to the saved image's path
         """
         if not self.image:
             return None
-
-        # Generate a unique filename based on timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(
-            self.screenshots_dir, f"{prefix}_{timestamp}.png"
-        )
-        self.image.save(screenshot_path)
-        logger.info(f"Image saved to: {screenshot_path}")
-        return screenshot_path
+        return self.writer.save(self.image)
 
     def get_image_as_base64(self):
         """
         Convert the current image to base64 encoded string
+
+        The image is downscaled, color reduced and encoded according to
+        the payload settings before it is base64 encoded.
         """
-        # Create a BytesIO buffer to save the image
-        buffer = BytesIO()
-        self.image.save(buffer, format="PNG")
+        data_url, _ = self.get_payload()
+        return data_url
+
+    def get_payload(self):
+        """
+        Encode the current image for upload
+
+        Returns:
+            tuple: (base64 data URL, metadata dict with the crop box and scale)
+        """
+        return encode_to_data_url(self.image, self.preprocessor)
+
+    @property
+    def watching(self):
+        """Whether watch mode is running"""
+        return self._watch_thread is not None
+
+    def start_watch(self, on_change, initial_image=None):
+        """Re-capture the last selected region and report when its content changes
 
-        img_bytes = buffer.getvalue()
-        base64_string = base64.b64encode(img_bytes).decode("utf-8")
+        Frames are grabbed on a background thread every WATCH_INTERVAL_MS.
+        Frames that match the last reported one cost a grab and a thumbnail
+        diff and are dropped. Must be called on the Tk main thread.
+
+        Args:
+            on_change: Called on the watch thread with each changed PIL Image
+            initial_image: Image of the region that was already reported
+
+        Returns:
+            bool: True if watch mode started
+        """
+        if self.watching:
+            return True
+        if self.last_region is None:
+            logger.warning("Watch mode needs a selected region first")
+            return False
+
+        display, region = self.last_region
+        self._watch_displays = list_displays(self.root)
+        origin = (display.left, display.top) if display is not None else (0, 0)
+        origin = (origin[0] + region[0], origin[1] + region[1])
+
+        detector = ChangeDetector()
+        detector.reset(initial_image)
+        # A fresh event per run, so a stopped thread can never be revived
+        self._watch_stop = threading.Event()
+
+        # The window stays visible while watching; keep its area out of the diff
+        self._update_watch_window_rect(self._watch_stop)
+
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(display, region, origin, detector, on_change, self._watch_stop),
+            name="RegionWatch",
+            daemon=True,
+        )
+        self._watch_thread.start()
+        logger.info(f"Watching region {region} every {Settings.WATCH_INTERVAL_MS} ms")
+        return True
+
+    def stop_watch(self):
+        """Stop watch mode. Must be called on the Tk main thread."""
+        if not self.watching:
+            return
+        self._watch_stop.set()
+        self._watch_thread = None
+        logger.info("Watch mode stopped")
+
+    def _update_watch_window_rect(self, stop):
+        """Main thread: track where the app window is for the watch thread"""
+        if stop.is_set():
+            return
+        self._watch_window_rect = self._own_window_rect(self._watch_displays)
+        if self.root:
+            self.root.after(
+                Settings.WATCH_INTERVAL_MS, self._update_watch_window_rect, stop
+            )
 
-        # Return with data URL prefix
-        return f"data:image/png;base64,{base64_string}"
+    def _watch_loop(self, display, region, origin, detector, on_change, stop):
+        """Watch thread: grab, diff and report until stopped"""
+        interval = Settings.WATCH_INTERVAL_MS / 1000
+        while not stop.wait(interval):
+            try:
+                image = self._grab(display, region)
+                self._blank_rect(image, self._watch_window_rect, origin)
+                if detector.update(image) and not stop.is_set():
+                    logger.info("Watched region changed")
+                    on_change(image)
+            except Exception as e:
+                logger.error(f"Watch capture failed: {str(e)}")
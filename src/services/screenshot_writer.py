@@ -0,0 +1,177 @@
+"""
+Background writer that saves screenshots to disk off the Tk main thread.
+"""
+
+import os
+import queue
+import hashlib
+import threading
+from concurrent.futures import Future
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+_shared_writer = None
+_shared_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer():
+    """Return the process-wide screenshot writer, creating it on first use
+
+    Returns:
+        ScreenshotWriter: The shared writer
+    """
+    global _shared_writer
+    if _shared_writer is None:
+        with _shared_writer_lock:
+            if _shared_writer is None:
+                app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                _shared_writer = ScreenshotWriter(os.path.join(app_root, "screenshots"))
+    return _shared_writer
+
+
+def content_hash(image):
+    """Hash of an image's mode, size and pixels
+
+    Args:
+        image: PIL Image object
+
+    Returns:
+        str: Hex digest, identical for identical frames
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.width}x{image.height}:".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class ScreenshotWriter:
+    """Saves screenshots as content-addressed PNG files on a worker thread
+
+    Files are named on the content hash alone, so identical frames map to
+    the same file and are written only once, whichever capture saved them.
+    Files are written to a temporary name and renamed into place, so a
+    crash never leaves a truncated PNG behind. Once the directory grows
+    past its size cap, the least recently saved files are deleted.
+    """
+
+    def __init__(self, directory, max_queue=None, max_bytes=None):
+        """
+        Initialize the writer and start its worker thread.
+
+        Args:
+            directory (str): Directory the screenshots are saved to
+            max_queue (int): Captures that may wait to be written
+            max_bytes (int): Disk usage cap for the directory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes or Settings.SCREENSHOT_DIR_MAX_BYTES
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._queue = queue.Queue(maxsize=max_queue or Settings.SCREENSHOT_QUEUE_SIZE)
+        # File name -> (mtime, size) of the saved PNGs, oldest first once sorted
+        self._files = {}
+        self._total_bytes = 0
+        self._scan()
+
+        self._thread = threading.Thread(
+            target=self._run, name="ScreenshotWriter", daemon=True
+        )
+        self._thread.start()
+
+    def save(self, image):
+        """Queue an image to be saved without blocking the caller
+
+        The image must not be modified afterwards. When the queue is full
+        the capture is dropped rather than stalling the UI.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Future: Resolves to the saved file's path, or None if dropped
+        """
+        future = Future()
+        try:
+            self._queue.put_nowait((image, future))
+        except queue.Full:
+            logger.warning("Screenshot writer queue is full, capture not saved")
+            future.set_result(None)
+        return future
+
+    def flush(self):
+        """Block until every queued screenshot has been written"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            image, future = self._queue.get()
+            try:
+                future.set_result(self._write(image))
+            except Exception as e:
+                logger.error(f"Failed to save screenshot: {str(e)}")
+                future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, image):
+        """Worker: write one screenshot atomically and enforce the size cap"""
+        name = f"{content_hash(image)}.png"
+        path = os.path.join(self.directory, name)
+
+        if os.path.exists(path):
+            # Same frame saved before; refresh it so eviction keeps it longest
+            os.utime(path)
+            self._remember(name, path)
+            logger.info(f"Image already saved: {path}")
+            return path
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            image.save(temp_path, format="PNG")
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self._remember(name, path)
+        self._evict()
+        logger.info(f"Image saved to: {path}")
+        return path
+
+    def _scan(self):
+        """Index the PNGs already in the directory and drop stale temp files"""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    os.remove(entry.path)
+                elif entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    self._files[entry.name] = (stat.st_mtime, stat.st_size)
+                    self._total_bytes += stat.st_size
+
+    def _remember(self, name, path):
+        stat = os.stat(path)
+        previous = self._files.pop(name, None)
+        if previous is not None:
+            self._total_bytes -= previous[1]
+        self._files[name] = (stat.st_mtime, stat.st_size)
+        self._total_bytes += stat.st_size
+
+    def _evict(self):
+        """Delete the oldest screenshots until the directory fits the cap"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for name, (_, size) in sorted(self._files.items(), key=lambda item: item[1][0]):
+            if self._total_bytes <= self.max_bytes or len(self._files) == 1:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            del self._files[name]
+            self._total_bytes -= size
+            logger.debug(f"Evicted screenshot {name}")
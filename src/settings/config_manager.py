@@ -16,6 +16,7 @@ class ConfigManager:
         self.api_key = self.settings.DEFAULT_API_KEY
         self.username = self.settings.DEFAULT_USERNAME
         self.user_id = self.settings.DEFAULT_USER_ID
+        self.capture_hotkey = self.settings.DEFAULT_CAPTURE_HOTKEY
 
         # Ensure config directory exists
         os.makedirs(self.settings.CONFIG_DIR, exist_ok=True)
@@ -23,13 +24,32 @@ class ConfigManager:
             self.settings.CONFIG_DIR, self.settings.CONFIG_FILE
         )
 
+        # Modification time of the config file when it was last read
+        self._loaded_mtime = None
+
         # Load existing configuration if available
         self.load_config()
 
+    def reload_if_changed(self):
+        """Reload configuration if the file changed since it was last read
+
+        Returns:
+            bool: True if the configuration was reloaded
+        """
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            return False
+        if mtime == self._loaded_mtime:
+            return False
+        self.load_config()
+        return True
+
     def load_config(self):
         """Load configuration from file"""
         try:
             if os.path.exists(self.config_path):
+                self._loaded_mtime = os.path.getmtime(self.config_path)
                 with open(self.config_path, "r") as f:
                     config = json.load(f)
                     self.current_theme = config.get(
@@ -41,6 +61,9 @@ class ConfigManager:
                         "username", self.settings.DEFAULT_USERNAME
                     )
                     self.user_id = config.get("user_id", self.settings.DEFAULT_USER_ID)
+                    self.capture_hotkey = config.get(
+                        "capture_hotkey", self.settings.DEFAULT_CAPTURE_HOTKEY
+                    )
                     logger.info(
                         f"Configuration loaded successfully from {self.config_path}"
                     )
@@ -59,10 +82,12 @@ class ConfigManager:
                 "api_key": self.api_key,
                 "username": self.username,
                 "user_id": self.user_id,
+                "capture_hotkey": self.capture_hotkey,
             }
             with open(self.config_path, "w") as f:
                 json.dump(config, f, indent=4)
                 logger.info(f"Configuration saved successfully to {self.config_path}")
+            self._loaded_mtime = os.path.getmtime(self.config_path)
         except Exception as e:
             logger.error(f"Error saving configuration: {str(e)}")
 
@@ -84,6 +109,11 @@ class ConfigManager:
         self.api_key = key
         self.save_config()
 
+    def set_capture_hotkey(self, hotkey):
+        """Set the global capture hotkey"""
+        self.capture_hotkey = hotkey
+        self.save_config()
+
     def set_user_info(self, username, user_id):
         """Set user information"""
         self.username = username
@@ -27,10 +27,109 @@ class Settings:
     ]
     WINDOWN_SIZE = "1000x700"
 
+    # Preview resizing
+    PREVIEW_RESIZE_THROTTLE_MS = 100
+    PREVIEW_RESIZE_DEBOUNCE_MS = 150
+    PREVIEW_PYRAMID_MIN_SIZE = 256
+    PREVIEW_TILE_SIZE = 256
+    PREVIEW_TILE_CACHE_SIZE = 128
+
+    # Region selection: grab once and select on the frozen frame
+    REGION_FROZEN_FRAME = True
+    # Cancel on ESC system-wide, not only when the overlay has focus
+    REGION_GLOBAL_ESC_HOOK = True
+
+    # Hiding the window before a capture: wait for <Unmap>, at most this long
+    WINDOW_HIDE_TIMEOUT_MS = 200
+    # Extra time for the compositor to repaint the area behind the window
+    WINDOW_HIDE_SETTLE_MS = 16
+    # Keep the window visible and blank its area in the capture instead
+    CAPTURE_EXCLUDE_SELF = False
+    CAPTURE_EXCLUDE_FILL = "black"
+
+    # Display to capture: "cursor", "primary", "all" or a display index
+    CAPTURE_DISPLAY = "cursor"
+
+    # Saved screenshots: writer queue length and disk usage cap
+    SCREENSHOT_QUEUE_SIZE = 8
+    SCREENSHOT_DIR_MAX_BYTES = 500 * 1024 * 1024
+
+    # Archive of analyzed captures and responses, relative to src/
+    ARCHIVE_ENABLED = True
+    ARCHIVE_DIR = "archive"
+
+    # Answer rendering: questions inserted at once, then per idle callback
+    RENDER_FIRST_CHUNK = 20
+    RENDER_CHUNK_SIZE = 25
+
+    # History window
+    HISTORY_PAGE_SIZE = 50
+    HISTORY_THUMBNAIL_SIZE = (64, 40)
+    HISTORY_THUMBNAIL_CACHE_SIZE = 200
+
+    # Watch mode: re-capture the selected region and analyze it when it changes
+    WATCH_INTERVAL_MS = 1000
+    WATCH_DIFF_SIZE = 128  # Longest side of the compared thumbnail
+    WATCH_PIXEL_THRESHOLD = 8  # Gray-level difference of a changed pixel
+    WATCH_CHANGE_THRESHOLD = 0.01  # Fraction of changed pixels that is new content
+    WATCH_SETTLE_FRAMES = 1  # Matching frames required before submitting
+
+    # Global hotkey that captures, analyzes and shows the answer in one go
+    DEFAULT_CAPTURE_HOTKEY = "ctrl+shift+x"  # Empty string disables it
+    HOTKEY_CAPTURE_MODE = "region"  # "region" or "full"
+
     # API configuration
     DEFAULT_API_URL = "https://api.example.com"
     DEFAULT_API_KEY = "your_api_key_here"
 
+    # HTTP connection pool shared by every API request
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 8
+    HTTP_KEEP_ALIVE = True
+    HTTP_CONNECT_TIMEOUT = 5
+    HTTP_READ_TIMEOUT = 120
+    HTTP_MAX_RETRIES = 1
+    HTTP_WARM_UP = True
+
+    # Request backend: "threaded" (worker pool) or "asyncio" (requires aiohttp)
+    API_BACKEND = "threaded"
+    API_MAX_IN_FLIGHT = 8
+    API_REQUEST_DEADLINE = 120
+    # Ask for NDJSON/SSE responses so questions render as they arrive
+    API_STREAMING = True
+    # Identical requests in flight at the same time share one upload
+    API_COALESCE_REQUESTS = True
+    # Bytes of a response body written to the log, the rest is only hashed
+    LOG_BODY_PREVIEW = 200
+
+    # Result cache for screenshots that were already analyzed, matched exactly
+    RESULT_CACHE_ENABLED = True
+    RESULT_CACHE_MAX_ENTRIES = 128
+    # Longest side of the grayscale thumbnail whose digest is the cache key
+    RESULT_CACHE_THUMBNAIL_SIZE = 512
+    RESULT_CACHE_DISK_ENABLED = True
+    RESULT_CACHE_DISK_MAX_ENTRIES = 1000
+
+    # Upload payload preprocessing
+    PAYLOAD_MAX_DIMENSION = 2560  # Longest side in pixels, 0 keeps full resolution
+    PAYLOAD_COLOR_MODE = "rgb"  # "rgb", "grayscale" or "palette"
+    PAYLOAD_PALETTE_COLORS = 64
+    PAYLOAD_FORMAT = "PNG"  # "PNG", "WEBP" or "JPEG"
+    PAYLOAD_PNG_COMPRESS_LEVEL = 6
+    PAYLOAD_QUALITY = 85  # WebP and JPEG only
+
+    # Encode payloads in worker processes so compression does not hold the GIL
+    ENCODE_PROCESS_POOL = True
+    ENCODE_POOL_WORKERS = 2
+
+    # Content-aware auto-crop applied before encoding
+    AUTO_CROP_ENABLED = True
+    AUTO_CROP_THRESHOLD = 24  # Gray-level difference from the background
+    AUTO_CROP_MARGIN = 8
+    AUTO_CROP_UNIFORM_SPREAD = 4  # Max-min spread of a flat row or column
+    AUTO_CROP_DROP_BANDS = False
+    AUTO_CROP_BAND_MIN_HEIGHT = 48
+
     # User information for API requests
     DEFAULT_USERNAME = "MinhPhan"
     DEFAULT_USER_ID = "12345"
@@ -10,6 +10,9 @@ from datetime import datetime
 from src.utils.logger import get_logger
 from src.assets.bootstrap import create_widget
 from src.services.retool_api_service import RetoolAPIService
+from src.services.result_cache import ResultCache
+from src.services.capture_archive import get_capture_archive
+from src.services.encode_pipeline import SpeculativeEncoder
 from src.settings.settings import Settings
 from src.ui.renderers.api_response_renderer import APIResponseRenderer
 
@@ -31,6 +34,31 @@ class AnswerPanel:
         self.main_layout = main_layout
         self.renderer = APIResponseRenderer()
         self.is_loading = False
+        self.pending_request = None
+        self.analyzing_frame = None
+        # Bumped by every new or cancelled analysis; results of older
+        # generations are dropped before they reach the handlers
+        self.generation = 0
+        # Called once when the current analysis is rendered, fails or is cancelled
+        self.on_complete = None
+
+        # Long-lived API service so analyses share the pooled HTTP session
+        self.api_service = RetoolAPIService()
+        self.api_service.warm_up()
+
+        # Responses for screenshots that were already analyzed
+        self.result_cache = ResultCache() if Settings.RESULT_CACHE_ENABLED else None
+
+        # Every analyzed capture and its response, for the history
+        self.archive = None
+        if Settings.ARCHIVE_ENABLED:
+            try:
+                self.archive = get_capture_archive()
+            except (OSError, ValueError) as e:
+                logger.error(f"Capture archive unavailable: {str(e)}")
+
+        # Encodes each new screenshot in the background before Analyze is clicked
+        self.encoder = SpeculativeEncoder(self.result_cache)
 
         # Set up the UI elements
         self.setup_content()
@@ -50,7 +78,7 @@ class AnswerPanel:
             "Button",
             style="secondary",
             text="Clear",
-            command=self.clear_answer,
+            command=self.reset_answer,
         )
         clear_btn.pack(side=LEFT, padx=3)
 
@@ -63,6 +91,36 @@ class AnswerPanel:
         )
         copy_btn.pack(side=LEFT, padx=3)
 
+        history_btn = create_widget(
+            button_container,
+            "Button",
+            style="primary",
+            text="History",
+            command=self.main_layout.open_history,
+        )
+        history_btn.pack(side=LEFT, padx=3)
+
+        # Jump to a question of a long answer
+        jump_container = ttk.Frame(button_frame)
+        jump_container.pack(side=LEFT, pady=2)
+
+        ttk.Label(jump_container, text="Question", font=("Helvetica", 9)).pack(
+            side=LEFT, padx=(3, 2)
+        )
+
+        self.jump_spinbox = ttk.Spinbox(jump_container, from_=1, to=1, width=5)
+        self.jump_spinbox.pack(side=LEFT, padx=2)
+        self.jump_spinbox.bind("<Return>", lambda event: self.jump_to_question())
+
+        jump_btn = create_widget(
+            jump_container,
+            "Button",
+            style="secondary",
+            text="Go",
+            command=self.jump_to_question,
+        )
+        jump_btn.pack(side=LEFT, padx=3)
+
         # Create a frame for loading indicator
         self.loading_frame = ttk.Frame(self.parent)
         self.loading_frame.pack(fill=X, pady=(0, 5))
@@ -113,10 +171,29 @@ class AnswerPanel:
     def clear_answer(self):
         """Clear the answer text."""
         logger.info("Clearing answer text")
+        self.renderer.cancel(self.answer_text)
+        self._update_jump_range()
         self.answer_text.config(state="normal")
         self.answer_text.delete("1.0", "end")
         self.answer_text.config(state="disabled")
 
+    def reset_answer(self):
+        """Cancel any pending analysis and clear the answer text."""
+        self.cancel_analysis()
+        self.clear_answer()
+
+    def cancel_analysis(self):
+        """Cancel the in-flight API request, if any."""
+        self.generation += 1
+        self.analyzing_frame = None
+        if self.pending_request is not None:
+            logger.info("Cancelling pending analysis request")
+            self.pending_request.cancel()
+            self.pending_request = None
+        if self.is_loading:
+            self.hide_loading_indicator()
+        self._notify_complete(False)
+
     def copy_answer(self):
         """Copy answer text to clipboard."""
         logger.info("Copying answer to clipboard")
@@ -130,6 +207,8 @@ class AnswerPanel:
         Args:
             text: The text to display
         """
+        self.renderer.cancel(self.answer_text)
+        self._update_jump_range()
         self.answer_text.config(state="normal")
         self.answer_text.delete("1.0", "end")
         self.answer_text.insert("1.0", text)
@@ -149,12 +228,55 @@ class AnswerPanel:
         self.loading_progress.stop()
         self.loading_frame.pack_forget()
 
-    def analyze_screenshot(self, image):
-        """Analyze the provided screenshot image using the Retool API.
+    def prepare_screenshot(self, frame):
+        """Start encoding a newly captured screenshot ahead of analysis.
+
+        Args:
+            frame: Shared Frame object, or None to drop the pending work
+        """
+        if frame is None:
+            self.encoder.cancel()
+            return
+
+        if self.is_loading:
+            # The answer being waited for is about an older capture
+            logger.info("New screenshot captured, cancelling the stale analysis")
+            self.cancel_analysis()
+            self.set_answer_text("Analysis cancelled: a new screenshot was captured")
+        self.encoder.submit(frame)
+
+    def analyze_screenshot(self, frame, on_complete=None):
+        """Analyze the provided screenshot using the Retool API.
 
         Args:
-            image: PIL Image object to analyze
+            frame: Shared Frame object to analyze
+            on_complete: Optional callback, called on the main thread with
+                True once the first question of the answer is on screen, or
+                False if the analysis failed or was superseded
         """
+        if self.is_loading and frame is self.analyzing_frame:
+            logger.info("This screenshot is already being analyzed")
+            if on_complete is not None:
+                # Report to this caller too when the running analysis completes
+                previous = self.on_complete
+
+                def notify_both(rendered):
+                    if previous is not None:
+                        previous(rendered)
+                    on_complete(rendered)
+
+                self.on_complete = notify_both
+            return
+
+        # Supersede the running analysis. Its request is only cancelled once
+        # the new one is submitted, so an identical upload can still be joined
+        stale_request = self.pending_request
+        self.pending_request = None
+        self.generation += 1
+        self.analyzing_frame = frame
+        self._notify_complete(False)
+        self.on_complete = on_complete
+
         # Clear previous answer
         self.clear_answer()
         logger.info("Analyzing screenshot")
@@ -168,53 +290,269 @@ class AnswerPanel:
         self.parent.update_idletasks()
 
         # Run API call in a background thread
+        # The worker keeps the frame alive until it has been encoded
+        frame.acquire()
         threading.Thread(
-            target=self._analyze_screenshot_thread, args=(image,), daemon=True
+            target=self._analyze_screenshot_thread,
+            args=(frame, self.generation, stale_request),
+            daemon=True,
         ).start()
 
-    def _analyze_screenshot_thread(self, image):
+    def _analyze_screenshot_thread(self, frame, generation, stale_request):
         """Background thread for running API analysis.
 
         Args:
-            image: PIL Image object to analyze
+            frame: Shared Frame object to analyze, released when done
+            generation: Generation of the analysis
+            stale_request: Request of the superseded analysis, or None
         """
-        from src.services.screenshot_service import ScreenshotService
+        try:
+            self._submit_analysis(frame, generation)
+        except Exception as e:
+            # Encoding failed before a request existed; report it like one
+            self.main_layout.dispatcher.post(
+                self._if_current(generation, self._handle_api_error), e
+            )
+        finally:
+            frame.release()
+            if stale_request is not None:
+                stale_request.cancel()
+
+    def _submit_analysis(self, frame, generation):
+        """Encode a frame, or answer it from the cache, and submit the request.
 
-        screenshot_service = ScreenshotService()
-        screenshot_service.image = image.copy()
-        base64_image = screenshot_service.get_image_as_base64()
+        Args:
+            frame: Shared Frame object to analyze
+            generation: Generation of the analysis
+        """
+        cache_key = self.encoder.cache_key_for(
+            frame, self.api_service.current_api_url()
+        )
+        if cache_key is not None:
+            cached_response = self.result_cache.get(cache_key)
+            if cached_response is not None:
+                logger.info("Result cache hit, skipping API request")
+                self.main_layout.dispatcher.post(
+                    self._if_current(generation, self._handle_api_response),
+                    cached_response,
+                )
+                return
+
+        payload = self.encoder.payload_for(frame)
+        if generation != self.generation:
+            logger.info("Analysis superseded before upload")
+            return
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"analysis_{timestamp}.png"
+        filename = f"analysis_{timestamp}.{self.encoder.preprocessor.extension}"
+
+        # Questions of a streamed response are shown as they arrive
+        handle_question = self._if_current(generation, self._handle_streamed_question)
+
+        def on_question(question):
+            self.main_layout.dispatcher.post(handle_question, question)
 
-        api_service = RetoolAPIService()
-        response_answer = api_service.send_request(
+        future = self.api_service.submit_request(
             user_name=Settings.DEFAULT_USERNAME,
             user_id=Settings.DEFAULT_USER_ID,
             file_name=filename,
-            image_data=base64_image,
+            image_data=payload.data_url,
+            metadata=payload.metadata,
+            on_question=on_question,
         )
+        # Tracked on the main thread, where the generation is bumped
+        self.main_layout.dispatcher.post(self._track_request, generation, future)
+
+        if cache_key is not None:
+            future.add_done_callback(lambda done: self._cache_response(cache_key, done))
+
+        archive_id = self._archive_payload(payload)
+        if archive_id is not None:
+            future.add_done_callback(
+                lambda done: self._archive_response(archive_id, done)
+            )
+
+        # Deliver the result to the main thread through the layout's dispatcher
+        self.main_layout.dispatcher.bind_future(
+            future,
+            self._if_current(generation, self._handle_api_response),
+            self._if_current(generation, self._handle_api_error),
+        )
+
+    def _if_current(self, generation, callback):
+        """Wrap a main-thread callback so it only runs for the latest analysis.
+
+        Args:
+            generation: Generation of the analysis the result belongs to
+            callback: Handler taking the result
+
+        Returns:
+            callable: Handler that drops results of superseded analyses
+        """
+
+        def deliver(result):
+            if generation != self.generation:
+                logger.debug("Dropping a result of a superseded analysis")
+                return
+            callback(result)
+
+        return deliver
 
-        # Schedule UI update on main thread
-        self.parent.after(0, lambda: self._handle_api_response(response_answer))
+    def _track_request(self, generation, future):
+        """Remember the request of the current analysis, or cancel a stale one."""
+        if generation != self.generation:
+            future.cancel()
+        elif not future.done():
+            self.pending_request = future
+
+    def _cache_response(self, cache_key, future):
+        """Store a successful response in the result cache.
+
+        Args:
+            cache_key: Key of the analyzed image
+            future: The completed request future
+        """
+        api_response = self._successful_response(future)
+        if api_response is not None:
+            self.result_cache.put(cache_key, api_response)
+
+    def _archive_payload(self, payload):
+        """Store the uploaded image in the capture archive.
+
+        Args:
+            payload: EncodedPayload that is being uploaded
+
+        Returns:
+            int: Archive entry id, or None if archiving is off or failed
+        """
+        if self.archive is None:
+            return None
+        width, height = payload.metadata.get("size", (0, 0))
+        try:
+            return self.archive.append(payload.image_bytes, width, height)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to archive capture: {str(e)}")
+            return None
+
+    def _archive_response(self, archive_id, future):
+        """Attach a successful response to its archived capture.
+
+        Args:
+            archive_id: Archive entry id of the analyzed image
+            future: The completed request future
+        """
+        api_response = self._successful_response(future)
+        if api_response is None:
+            return
+        try:
+            self.archive.set_response(archive_id, api_response)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to archive response: {str(e)}")
+
+    @staticmethod
+    def _successful_response(future):
+        """Return a completed request's response unless it failed, else None"""
+        if future.cancelled() or future.exception() is not None:
+            return None
+        api_response = future.result()
+        return api_response if api_response.ok else None
+
+    def _handle_streamed_question(self, question):
+        """Show one question of a streamed response as soon as it arrives.
+
+        Args:
+            question: The Question that arrived
+        """
+        self.renderer.append_question(self.answer_text, question)
+        # Keep whatever is being typed in the jump box, only extend its range
+        self._update_jump_range(reset=False)
+        if self.on_complete is not None:
+            # The first question is on screen once the renderer's idle chunk ran
+            self.answer_text.after_idle(
+                self._if_current(self.generation, self._notify_complete), True
+            )
 
     def _handle_api_response(self, api_response):
         """Handle the API response and hide loading indicator.
 
         Args:
-            api_response: The API response dictionary
+            api_response: The decoded AnalysisResponse
         """
+        self.pending_request = None
+        self.analyzing_frame = None
+        streamed_count = self.renderer.question_count(self.answer_text)
+        streamed = 0 < streamed_count == len(api_response.questions)
+
         # Hide loading indicator first
         self.hide_loading_indicator()
 
-        # Then render the response
+        # Then render the response, unless every question was already streamed
+        if not streamed:
+            self.render_api_response(api_response)
+        self._notify_complete(True)
+
+    def _handle_api_error(self, error):
+        """Handle a request that failed with an exception.
+
+        Args:
+            error: The exception raised by the request
+        """
+        logger.error(f"Screenshot analysis failed: {str(error)}")
+        self.pending_request = None
+        self.analyzing_frame = None
+        self.hide_loading_indicator()
+        self.set_answer_text(f"Analysis failed: {str(error)}")
+        self._notify_complete(False)
+
+    def _notify_complete(self, rendered):
+        """Call and clear the completion callback of the current analysis.
+
+        Args:
+            rendered: Whether an answer was rendered
+        """
+        on_complete = self.on_complete
+        self.on_complete = None
+        if on_complete is not None:
+            on_complete(rendered)
+
+    def show_archived_response(self, api_response):
+        """Show a stored response from the history instead of the current one.
+
+        Args:
+            api_response: The archived AnalysisResponse, or None
+        """
+        self.cancel_analysis()
+        if api_response is None:
+            self.set_answer_text("No answer was stored for this capture")
+            return
         self.render_api_response(api_response)
 
     def render_api_response(self, api_response):
         """Render the formatted API response in the answer section.
 
         Args:
-            api_response: The API response dictionary
+            api_response: The decoded AnalysisResponse
         """
         # Delegate to the specialized renderer
         self.renderer.render(self.answer_text, api_response)
+        self._update_jump_range()
+
+    def jump_to_question(self):
+        """Scroll the answer to the question number in the jump box."""
+        try:
+            number = int(self.jump_spinbox.get())
+        except ValueError:
+            return
+        if not self.renderer.jump_to(self.answer_text, number):
+            logger.info(f"No question {number} in the current answer")
+
+    def _update_jump_range(self, reset=True):
+        """Limit the jump box to the questions of the current answer.
+
+        Args:
+            reset: Also put the box back on the first question
+        """
+        count = self.renderer.question_count(self.answer_text)
+        self.jump_spinbox.configure(to=max(1, count))
+        if reset:
+            self.jump_spinbox.set(1 if count else "")
@@ -0,0 +1,216 @@
+"""
+History window that browses archived captures and their answers.
+"""
+
+import io
+import tkinter as tk
+from tkinter import ttk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from PIL import Image, ImageTk
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+
+class HistoryWindow(tk.Toplevel):
+    """Paginated list of archived captures with lazily generated thumbnails
+
+    Only one page of rows exists in the Treeview at a time. Thumbnails are
+    decoded on a worker thread for the rows of the current page only and
+    kept in a bounded LRU cache, so memory stays flat however large the
+    archive grows.
+    """
+
+    def __init__(self, parent, archive, dispatcher, on_select=None):
+        """
+        Create the window and show the newest page.
+
+        Args:
+            parent: The parent widget
+            archive: CaptureArchive to browse
+            dispatcher: MainThreadDispatcher that delivers thumbnails to Tk
+            on_select: Called with the entry id of the selected capture
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.archive = archive
+        self.dispatcher = dispatcher
+        self.on_select = on_select
+
+        self.page = 0
+        self.page_size = Settings.HISTORY_PAGE_SIZE
+        self.thumbnail_size = Settings.HISTORY_THUMBNAIL_SIZE
+        self.cache_size = max(Settings.HISTORY_THUMBNAIL_CACHE_SIZE, self.page_size)
+        # Entry id -> PhotoImage, least recently used first
+        self._thumbnails = OrderedDict()
+        # Bumped on every page change so late thumbnails of old pages are dropped
+        self._generation = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="HistoryThumbnails"
+        )
+
+        # Configure window
+        self.title("History")
+        self.geometry("560x520")
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.create_widgets()
+        self.center_window()
+        self.show_page(0)
+
+    def create_widgets(self):
+        """Create the list and the pagination controls"""
+        main_frame = ttk.Frame(self, padding="10 10 10 10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Rows must be tall enough for the thumbnails
+        style = ttk.Style(self)
+        style.configure("History.Treeview", rowheight=self.thumbnail_size[1] + 6)
+
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(
+            list_frame,
+            columns=("time", "size", "answer"),
+            style="History.Treeview",
+            selectmode="browse",
+        )
+        self.tree.heading("#0", text="Capture")
+        self.tree.heading("time", text="Time")
+        self.tree.heading("size", text="Size")
+        self.tree.heading("answer", text="Answer")
+        self.tree.column("#0", width=self.thumbnail_size[0] + 30, stretch=False)
+        self.tree.column("time", width=160)
+        self.tree.column("size", width=100)
+        self.tree.column("answer", width=80)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = ttk.Scrollbar(list_frame, command=self.tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+
+        # Pagination bar at the bottom
+        nav_frame = ttk.Frame(main_frame)
+        nav_frame.pack(fill=tk.X, pady=(10, 0))
+
+        self.newer_btn = ttk.Button(
+            nav_frame, text="< Newer", command=lambda: self.show_page(self.page - 1)
+        )
+        self.newer_btn.pack(side=tk.LEFT)
+
+        self.older_btn = ttk.Button(
+            nav_frame, text="Older >", command=lambda: self.show_page(self.page + 1)
+        )
+        self.older_btn.pack(side=tk.LEFT, padx=5)
+
+        self.page_label = ttk.Label(nav_frame)
+        self.page_label.pack(side=tk.LEFT, padx=10)
+
+        refresh_btn = ttk.Button(
+            nav_frame, text="Refresh", command=lambda: self.show_page(self.page)
+        )
+        refresh_btn.pack(side=tk.RIGHT)
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.archive) // self.page_size))
+
+    def show_page(self, page):
+        """Replace the rows with one page of entries, newest first.
+
+        Args:
+            page: Zero-based page number, clamped to the valid range
+        """
+        self.page = min(max(0, page), self.page_count - 1)
+        self._generation += 1
+
+        self.tree.delete(*self.tree.get_children())
+        entries = self.archive.entries(self.page * self.page_size, self.page_size)
+        missing = []
+        for entry in entries:
+            thumbnail = self._cached_thumbnail(entry.entry_id)
+            if thumbnail is None:
+                missing.append(entry.entry_id)
+            self.tree.insert(
+                "",
+                tk.END,
+                iid=str(entry.entry_id),
+                image=thumbnail or "",
+                values=(
+                    datetime.fromtimestamp(entry.timestamp).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                    f"{entry.width}x{entry.height}",
+                    "Yes" if entry.has_response else "No",
+                ),
+            )
+
+        # Thumbnails of this page only, in display order
+        for entry_id in missing:
+            self._executor.submit(self._make_thumbnail, entry_id, self._generation)
+
+        self.page_label.configure(
+            text=f"Page {self.page + 1} of {self.page_count} ({len(self.archive)} captures)"
+        )
+        self.newer_btn.configure(state=tk.NORMAL if self.page > 0 else tk.DISABLED)
+        self.older_btn.configure(
+            state=tk.NORMAL if self.page < self.page_count - 1 else tk.DISABLED
+        )
+
+    def close(self):
+        """Stop the thumbnail worker and close the window"""
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._thumbnails.clear()
+        self.destroy()
+
+    def _cached_thumbnail(self, entry_id):
+        thumbnail = self._thumbnails.get(entry_id)
+        if thumbnail is not None:
+            self._thumbnails.move_to_end(entry_id)
+        return thumbnail
+
+    def _make_thumbnail(self, entry_id, generation):
+        """Worker: decode a capture and shrink it to a thumbnail"""
+        if generation != self._generation:
+            return
+        try:
+            image = Image.open(io.BytesIO(self.archive.read_payload(entry_id)))
+            image.draft("RGB", self.thumbnail_size)
+            image.thumbnail(self.thumbnail_size, Image.Resampling.BILINEAR)
+            image = image.convert("RGB")
+        except Exception as e:
+            logger.error(f"Failed to build thumbnail for entry {entry_id}: {str(e)}")
+            return
+        self.dispatcher.post(self._set_thumbnail, entry_id, image, generation)
+
+    def _set_thumbnail(self, entry_id, image, generation):
+        """Main thread: cache a thumbnail and show it if its row is on screen"""
+        if generation != self._generation or not self.winfo_exists():
+            return
+        thumbnail = ImageTk.PhotoImage(image, master=self)
+        self._thumbnails[entry_id] = thumbnail
+        while len(self._thumbnails) > self.cache_size:
+            self._thumbnails.popitem(last=False)
+        if self.tree.exists(str(entry_id)):
+            self.tree.item(str(entry_id), image=thumbnail)
+
+    def _on_tree_select(self, event):
+        selection = self.tree.selection()
+        if selection and self.on_select:
+            self.on_select(int(selection[0]))
+
+    def center_window(self):
+        """Center the window over the parent"""
+        self.update_idletasks()
+        width = self.winfo_width()
+        height = self.winfo_height()
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() / 2) - (width / 2)
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() / 2) - (height / 2)
+        self.geometry(f"{width}x{height}+{int(x)}+{int(y)}")
@@ -2,12 +2,20 @@
 Main layout component that coordinates the overall UI structure.
 """
 
+import io
 import time
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH, LEFT, RIGHT, YES
 from src.utils.logger import get_logger
+from src.settings.settings import Settings
+from src.utils.dispatcher import MainThreadDispatcher
+from src.settings.config_manager import ConfigManager
+from src.services.frame import Frame
+from src.services.hotkey_service import HotkeyService
 from src.ui.components.preview_panel import PreviewPanel
 from src.ui.components.answer_panel import AnswerPanel
+from src.ui.components.history_window import HistoryWindow
+from PIL import Image
 
 logger = get_logger()
 
@@ -24,9 +32,16 @@ class MainLayout:
         """
         self.parent = parent
         self.last_resize_time = 0
-        self.original_screenshot = None
+        self.resize_job = None
+        self.current_frame = None
+        self.history_window = None
         self.last_window_width = None
         self.last_window_height = None
+        # Key press timestamp of the running hotkey pipeline, None when idle
+        self.hotkey_pressed_at = None
+
+        # Single entry point for results coming back from worker threads
+        self.dispatcher = MainThreadDispatcher(self.parent)
 
         # Create main content frame
         self.content_frame = ttk.Frame(self.parent)
@@ -40,6 +55,24 @@ class MainLayout:
         root = self.parent.winfo_toplevel()
         root.bind("<Configure>", self.on_window_resize)
 
+        # Global capture-and-analyze hotkey, handed to the main loop by the
+        # dispatcher. The pipeline waits modally for the region selection, so
+        # it runs from after_idle rather than inside the dispatcher's poll,
+        # which keeps delivering other results meanwhile.
+        self.hotkey_service = None
+        hotkey = ConfigManager().capture_hotkey
+        if hotkey:
+            self.hotkey_service = HotkeyService(
+                hotkey,
+                lambda pressed_at: self.dispatcher.post(
+                    root.after_idle, self.run_hotkey_pipeline, pressed_at
+                ),
+            )
+            self.hotkey_service.start()
+            self.content_frame.bind(
+                "<Destroy>", lambda event: self.hotkey_service.stop()
+            )
+
     def setup_layout(self):
         """Set up the main layout with preview and answer panels."""
         # Split into two columns: Preview and Answer with 2:1 ratio
@@ -62,7 +95,12 @@ class MainLayout:
         self.answer_panel = AnswerPanel(self.answer_frame, self)
 
     def on_window_resize(self, event):
-        """Update the layout on window resize with throttling."""
+        """Update the layout on window resize.
+
+        A throttled leading edge keeps the preview roughly in step while the
+        window is being dragged, and a debounced trailing edge applies the
+        final size once events stop arriving.
+        """
         # Skip if not from parent or root window
         if event.widget != self.parent and event.widget != self.parent.master:
             return
@@ -72,51 +110,91 @@ class MainLayout:
 
         # Only proceed if dimensions actually changed
         if (
-            self.last_window_width != current_width
-            or self.last_window_height != current_height
+            self.last_window_width == current_width
+            and self.last_window_height == current_height
+        ):
+            return
+        self.last_window_width = current_width
+        self.last_window_height = current_height
+
+        current_time = time.time()
+        if (
+            current_time - self.last_resize_time
+            >= Settings.PREVIEW_RESIZE_THROTTLE_MS / 1000
         ):
-            current_time = time.time()
-            # Throttle updates to avoid excessive resizing calculations
-            if current_time - self.last_resize_time < 0.1:
-                return
-
-            # Resize image in preview area if there's one
-            self.preview_panel.resize_image()
-
-            # Update the preview and answer frames to maintain a 2:1 ratio
-            total_width = self.content_frame.winfo_width()
-            if total_width > 100:  # Only adjust if valid dimensions
-                # Calculate width for preview (2/3) and answer (1/3) frames
-                preview_width = int(total_width * 0.67)  # Approximately 2/3
-                answer_width = total_width - preview_width
-
-                # Update the widths
-                self.preview_frame.configure(width=preview_width)
-                self.answer_frame.configure(width=answer_width)
-
-            # Update timing and dimensions for next resize
             self.last_resize_time = current_time
-            self.last_window_width = current_width
-            self.last_window_height = current_height
+            self.apply_resize(high_quality=False)
+
+        # Restart the trailing-edge timer so the last event is never dropped
+        if self.resize_job is not None:
+            self.parent.after_cancel(self.resize_job)
+        self.resize_job = self.parent.after(
+            Settings.PREVIEW_RESIZE_DEBOUNCE_MS, self._finish_resize
+        )
+
+    def _finish_resize(self):
+        """Trailing edge of a resize: apply the final size in high quality."""
+        self.resize_job = None
+        self.apply_resize(high_quality=True)
+
+    def apply_resize(self, high_quality):
+        """Resize the preview and keep the panels at a 2:1 ratio.
+
+        Args:
+            high_quality: Whether to follow up with a Lanczos resample off the main thread
+        """
+        # Resize image in preview area if there's one
+        self.preview_panel.resize_image(high_quality=high_quality)
+
+        # Update the preview and answer frames to maintain a 2:1 ratio
+        total_width = self.content_frame.winfo_width()
+        if total_width > 100:  # Only adjust if valid dimensions
+            # Calculate width for preview (2/3) and answer (1/3) frames
+            preview_width = int(total_width * 0.67)  # Approximately 2/3
+            answer_width = total_width - preview_width
+
+            # Update the widths
+            self.preview_frame.configure(width=preview_width)
+            self.answer_frame.configure(width=answer_width)
 
     def get_content_frame(self):
         """Return the main content frame."""
         return self.content_frame
 
-    def set_screenshot(self, image):
-        """Set the current screenshot image.
+    def set_screenshot(self, frame, prepare=True):
+        """Set the current screenshot.
 
         Args:
-            image: PIL Image object
+            frame: Shared Frame object; the layout takes its own reference
+            prepare: Treat it as a new capture and start encoding it; False
+                for a frame that already has its answer, e.g. from the history
         """
-        if image:
-            self.original_screenshot = image.copy()
+        if frame:
+            frame.acquire()
+            if self.current_frame is not None:
+                self.current_frame.release()
+            self.current_frame = frame
+            if prepare:
+                # Start encoding right away so Analyze can upload immediately
+                self.answer_panel.prepare_screenshot(frame)
+            else:
+                # Only drop the work prepared for the previous capture
+                self.answer_panel.prepare_screenshot(None)
             # Update the preview with the new image
-            self.preview_panel.set_image(self.original_screenshot)
+            self.preview_panel.set_image(frame)
+            Frame.log_memory_report()
+
+    def clear_screenshot(self):
+        """Forget the current screenshot and cancel any work prepared for it."""
+        if self.current_frame is not None:
+            self.current_frame.release()
+            self.current_frame = None
+        self.answer_panel.prepare_screenshot(None)
+        Frame.log_memory_report()
 
     def analyze_screenshot(self):
         """Delegate screenshot analysis to the answer panel."""
-        if self.original_screenshot is None:
+        if self.current_frame is None:
             logger.warning("No screenshot available to analyze")
 
             # Use the common message dialog function with English message
@@ -136,4 +214,107 @@ class MainLayout:
             )
             return
 
-        self.answer_panel.analyze_screenshot(self.original_screenshot)
+        self.answer_panel.analyze_screenshot(self.current_frame)
+
+    def open_history(self):
+        """Open the history window, or raise it if it is already open."""
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.lift()
+            return
+        if self.answer_panel.archive is None:
+            from src.utils.helpers import show_app_centered_message
+
+            show_app_centered_message(
+                self.parent,
+                "Notification",
+                "The capture archive is disabled or could not be opened",
+                "OK",
+                "primary",
+            )
+            return
+        self.history_window = HistoryWindow(
+            self.parent.winfo_toplevel(),
+            self.answer_panel.archive,
+            self.dispatcher,
+            on_select=self.show_history_entry,
+        )
+
+    def show_history_entry(self, entry_id):
+        """Show an archived capture and its stored answer.
+
+        Args:
+            entry_id: Archive entry id
+        """
+        archive = self.answer_panel.archive
+        try:
+            image = Image.open(io.BytesIO(archive.read_payload(entry_id)))
+            image = image.convert("RGB")
+            api_response = archive.read_response(entry_id)
+        except Exception as e:
+            logger.error(f"Failed to load history entry {entry_id}: {str(e)}")
+            return
+
+        frame = Frame(image, source="history")
+        self.set_screenshot(frame, prepare=False)
+        frame.release()
+        self.answer_panel.show_archived_response(api_response)
+
+    def run_hotkey_pipeline(self, pressed_at):
+        """Capture, encode, upload and render in one go, starting from a hotkey.
+
+        The window is hidden for the capture and only shown again once the
+        first question of the answer is on screen. Encoding starts as soon
+        as the frame exists, so the upload follows the capture without
+        waiting on the UI.
+
+        Args:
+            pressed_at: time.perf_counter() timestamp of the key press
+        """
+        if self.hotkey_pressed_at is not None:
+            logger.info("Hotkey ignored, a capture is already in progress")
+            return
+        self.hotkey_pressed_at = pressed_at
+        logger.info(
+            f"Hotkey pipeline started "
+            f"({(time.perf_counter() - pressed_at) * 1000:.1f} ms after key press)"
+        )
+
+        try:
+            if Settings.HOTKEY_CAPTURE_MODE == "full":
+                captured = self.preview_panel.take_screenshot(keep_hidden=True)
+            else:
+                captured = self.preview_panel.take_region_screenshot(keep_hidden=True)
+        except Exception as e:
+            logger.error(f"Hotkey capture failed: {str(e)}")
+            captured = False
+
+        if not captured or self.current_frame is None:
+            self._finish_hotkey_pipeline(False)
+            return
+
+        logger.info(
+            f"Hotkey capture ready after "
+            f"{(time.perf_counter() - pressed_at) * 1000:.1f} ms"
+        )
+        self.answer_panel.analyze_screenshot(
+            self.current_frame, on_complete=self._finish_hotkey_pipeline
+        )
+
+    def _finish_hotkey_pipeline(self, rendered):
+        """Show the window again and log the key-press-to-first-answer latency.
+
+        Args:
+            rendered: Whether an answer was rendered
+        """
+        pressed_at = self.hotkey_pressed_at
+        self.hotkey_pressed_at = None
+
+        root = self.parent.winfo_toplevel()
+        root.deiconify()
+        root.lift()
+
+        if pressed_at is not None and rendered:
+            logger.info(
+                f"Hotkey to first rendered answer: "
+                f"{(time.perf_counter() - pressed_at) * 1000:.1f} ms"
+            )
@@ -2,12 +2,15 @@
 Preview panel component for displaying and capturing screenshots.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import BOTH, LEFT, RIGHT, YES, X, CENTER
+from ttkbootstrap.constants import BOTH, LEFT, RIGHT, YES, X
 from src.utils.logger import get_logger
 from src.assets.bootstrap import create_widget
-from PIL import ImageTk
+from PIL import Image
 from src.services.screenshot_service import ScreenshotService
+from src.services.frame import Frame
+from src.ui.components.tiled_viewport import TiledViewport
 
 logger = get_logger()
 
@@ -25,12 +28,22 @@ class PreviewPanel:
         """
         self.parent = parent
         self.main_layout = main_layout
-        self.screenshot_image = None
-        self.original_image = None
+        self.frame = None
+
+        # Pyramid builds and high-quality resamples run here, one at a time
+        self.resample_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="PreviewResample"
+        )
+        self.resize_generation = 0
 
         # Set up the UI elements
         self.setup_content()
 
+        # One long-lived service; it prepares the region overlay up front
+        self.screenshot_service = ScreenshotService()
+        # Set the root window to avoid capturing the app itself
+        self.screenshot_service.set_root_window(self.parent.winfo_toplevel())
+
     def setup_content(self):
         """Set up the preview panel UI elements."""
         # Create a frame to hold title and buttons at the top
@@ -61,6 +74,16 @@ class PreviewPanel:
         )
         region_screenshot_btn.pack(side=LEFT, padx=3)
 
+        # Toggle watch mode on the selected region
+        self.watch_btn = create_widget(
+            btn_frame,
+            "Button",
+            style="secondary",
+            text="Watch",
+            command=self.toggle_watch,
+        )
+        self.watch_btn.pack(side=LEFT, padx=3)
+
         # Add analyze button
         analyze_btn = create_widget(
             btn_frame,
@@ -85,74 +108,168 @@ class PreviewPanel:
         self.image_container = ttk.Frame(self.parent)
         self.image_container.pack(fill=BOTH, expand=YES, pady=3)
 
-        # Create a label to display the screenshot (centered)
-        self.image_label = ttk.Label(self.image_container)
-        self.image_label.pack(anchor=CENTER, expand=YES)
+        # Zoomable viewport that displays the screenshot (centered when fitted)
+        self.viewport = TiledViewport(
+            self.image_container, on_fit=lambda: self.resize_image(high_quality=True)
+        )
+        self.viewport.canvas.pack(fill=BOTH, expand=YES)
 
-    def take_screenshot(self):
-        """Capture full screen screenshot and display in preview area."""
-        logger.info("Taking screenshot")
+    def take_screenshot(self, keep_hidden=False):
+        """Capture full screen screenshot and display in preview area.
 
-        # Use the screenshot service
-        screenshot_service = ScreenshotService()
+        Args:
+            keep_hidden: Leave the app window hidden after the capture
 
-        # Set the root window to avoid capturing the app itself
-        root = self.parent.winfo_toplevel()
-        screenshot_service.set_root_window(root)
+        Returns:
+            bool: Whether a screenshot was captured
+        """
+        logger.info("Taking screenshot")
+        screenshot_service = self.screenshot_service
 
         # Take the screenshot
-        screenshot_service.take_screenshot(save_to_disk=False)
+        screenshot_service.take_screenshot(save_to_disk=False, keep_hidden=keep_hidden)
 
-        # Store the original image for resizing when window changes
         if screenshot_service.image:
-            self.set_image(screenshot_service.image)
-            # Also update the main layout's reference to the screenshot
-            self.main_layout.set_screenshot(screenshot_service.image)
+            self._publish_capture(screenshot_service, "screenshot")
+            return True
+        return False
 
-    def take_region_screenshot(self):
-        """Capture screen region screenshot and display in preview area."""
-        logger.info("Taking region screenshot")
+    def take_region_screenshot(self, keep_hidden=False):
+        """Capture screen region screenshot and display in preview area.
 
-        # Use the screenshot service
-        screenshot_service = ScreenshotService()
+        Args:
+            keep_hidden: Leave the app window hidden after a successful capture
 
-        # Set the root window to avoid capturing the app itself
-        root = self.parent.winfo_toplevel()
-        screenshot_service.set_root_window(root)
+        Returns:
+            bool: Whether a region was captured
+        """
+        logger.info("Taking region screenshot")
+        screenshot_service = self.screenshot_service
 
         # Take region screenshot
-        screenshot_service.take_region_screenshot(save_to_disk=False)
+        screenshot_service.take_region_screenshot(
+            save_to_disk=False, keep_hidden=keep_hidden
+        )
 
         # If a region was selected and captured successfully
         if screenshot_service.image:
-            self.set_image(screenshot_service.image)
-            # Also update the main layout's reference to the screenshot
-            self.main_layout.set_screenshot(screenshot_service.image)
-        else:
-            logger.info("Region selection was cancelled or failed")
+            self._publish_capture(screenshot_service, "region_screenshot")
+            return True
+        logger.info("Region selection was cancelled or failed")
+        return False
 
-    def set_image(self, image):
-        """Set and display an image in the preview panel.
+    def _publish_capture(self, screenshot_service, source):
+        """Wrap the service's capture in a shared frame and hand it to the layout.
 
         Args:
-            image: PIL Image object
+            screenshot_service: Service holding the captured image
+            source: Label for the frame in the memory report
         """
-        if image:
-            self.original_image = image.copy()
-            self.resize_image()
+        image = screenshot_service.image
+        # The frame owns the pixels now, the service keeps no reference
+        screenshot_service.image = None
+        self._publish_image(image, source)
 
-    def resize_image(self):
-        """Resize the original image to fit the current container and display it."""
-        if self.original_image is None:
+    def _publish_image(self, image, source):
+        """Wrap an image in a shared frame and hand it to the layout.
+
+        Args:
+            image: PIL Image object, owned by the frame from now on
+            source: Label for the frame in the memory report
+        """
+        frame = Frame(image, source=source)
+        self.main_layout.set_screenshot(frame)
+        frame.release()
+
+    def toggle_watch(self):
+        """Start or stop watching a screen region for new content.
+
+        Starting asks for the region to watch, analyzes it right away and
+        then only re-analyzes when the region changes.
+        """
+        service = self.screenshot_service
+        if service.watching:
+            service.stop_watch()
+            self.watch_btn.configure(text="Watch", bootstyle="secondary")
             return
 
-        self.parent.update_idletasks()
+        if not self.take_region_screenshot():
+            return
+        if self.main_layout.current_frame is None:
+            return
+
+        started = service.start_watch(
+            on_change=lambda image: self.main_layout.dispatcher.post(
+                self._on_watch_change, image
+            ),
+            initial_image=self.main_layout.current_frame.image,
+        )
+        if started:
+            self.watch_btn.configure(text="Stop Watch", bootstyle="danger")
+            self.analyze_screenshot()
+
+    def _on_watch_change(self, image):
+        """Show and analyze a watched region whose content changed."""
+        if not self.screenshot_service.watching:
+            return
+        self._publish_image(image, "watch")
+        self.analyze_screenshot()
+
+    def set_image(self, frame):
+        """Set and display a frame in the preview panel.
 
+        Args:
+            frame: Shared Frame object
+        """
+        if frame:
+            frame.acquire()
+            if self.frame is not None:
+                self.frame.release()
+            self.frame = frame
+            self.viewport.set_frame(frame)
+            # Build the pyramid first so later resizes start from a small level
+            self._submit_resample(self.frame.build_pyramid)
+            self.resize_image(high_quality=True)
+
+    def resize_image(self, high_quality=False):
+        """Resize the frame to fit the current container and display it.
+
+        A quick bilinear resample from the nearest pyramid level is shown
+        immediately. With high_quality, a Lanczos resample is then computed
+        off the main thread and replaces it unless another resize came first.
+
+        Args:
+            high_quality: Whether to follow up with the Lanczos resample
+        """
+        if self.frame is None:
+            return
+
+        # While zoomed in the viewport lays out its own tiles
+        if self.viewport.zoomed:
+            self.viewport.refresh()
+            return
+
+        target_size = self._fit_size()
+        self.resize_generation += 1
+
+        level = self.frame.nearest_level(*target_size)
+        self._show_image(level.resize(target_size, Image.Resampling.BILINEAR))
+
+        if high_quality:
+            self._submit_resample(
+                self._high_quality_resample,
+                self.frame.acquire(),
+                target_size,
+                self.resize_generation,
+            )
+
+    def _fit_size(self):
+        """Return the largest size that fits the container and keeps the aspect ratio."""
         # Calculate maximum dimensions for the image to fit in the container
         container_width = self.image_container.winfo_width() - 20
         container_height = self.image_container.winfo_height() - 20
 
-        logger.info(f"Container dimensions: {container_width}x{container_height}")
+        logger.debug(f"Container dimensions: {container_width}x{container_height}")
 
         # If container dimensions are not available yet, use reasonable defaults
         if container_width < 100:
@@ -161,35 +278,65 @@ class PreviewPanel:
             container_height = 280
 
         # Calculate scale factor to maintain aspect ratio
-        img_aspect = self.original_image.width / self.original_image.height
+        img_aspect = self.frame.width / self.frame.height
         container_aspect = container_width / container_height
 
         # Determine dimensions based on aspect ratios
         if img_aspect >= container_aspect:
             # Scale to container width
             new_width = container_width
-            new_height = int(new_width / img_aspect)
+            new_height = max(1, int(new_width / img_aspect))
         else:  # Image is taller than container
             # Scale to container height
             new_height = container_height
-            new_width = int(new_height * img_aspect)
+            new_width = max(1, int(new_height * img_aspect))
 
-        logger.info(f"Resizing image to: {new_width}x{new_height}")
+        logger.debug(f"Resizing image to: {new_width}x{new_height}")
+        return new_width, new_height
+
+    def _submit_resample(self, function, *args):
+        """Run resampling work on the preview's background worker."""
+        self.resample_executor.submit(function, *args)
+
+    def _high_quality_resample(self, frame, target_size, generation):
+        """Worker: Lanczos resample from the nearest level, then hand back to Tk.
+
+        Args:
+            frame: Frame acquired for this job, released when done
+            target_size: (width, height) to resample to
+            generation: Resize generation the result belongs to
+        """
+        try:
+            if generation != self.resize_generation:
+                return
+            level = frame.nearest_level(*target_size)
+            resized_image = level.resize(target_size, Image.Resampling.LANCZOS)
+        finally:
+            frame.release()
+
+        self.main_layout.dispatcher.post(
+            self._show_high_quality, resized_image, generation
+        )
 
-        # Resize the image with the calculated dimensions
-        resized_image = self.original_image.resize((new_width, new_height), 1)
+    def _show_high_quality(self, resized_image, generation):
+        """Display a high-quality resample unless a newer resize superseded it."""
+        if generation == self.resize_generation and self.frame is not None:
+            self._show_image(resized_image)
 
-        # Convert to PhotoImage and display
-        self.screenshot_image = ImageTk.PhotoImage(resized_image)
-        self.image_label.config(image=self.screenshot_image)
+    def _show_image(self, resized_image):
+        """Display a resized image in the viewport's fit mode."""
+        self.viewport.show_fit_image(resized_image)
 
     def refresh_preview(self):
         """Clear the current preview image."""
         logger.info("Refreshing preview content")
-        self.image_label.config(image="")
-        self.original_image = None
+        self.viewport.clear()
+        self.resize_generation += 1
+        if self.frame is not None:
+            self.frame.release()
+            self.frame = None
         # Also clear the main layout's reference
-        self.main_layout.original_screenshot = None
+        self.main_layout.clear_screenshot()
 
     def analyze_screenshot(self):
         """Trigger analysis of the current screenshot."""
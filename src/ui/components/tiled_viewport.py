@@ -0,0 +1,279 @@
+"""
+Zoomable, tiled viewport for previewing very large screenshots.
+"""
+
+import math
+import tkinter as tk
+from collections import OrderedDict
+from PIL import Image, ImageTk
+from src.utils.logger import get_logger
+from src.settings.settings import Settings
+
+logger = get_logger()
+
+ZOOM_STEP = 1.25
+MAX_ZOOM = 4.0
+
+
+class TiledViewport:
+    """Canvas that shows a frame scaled to fit or zoomed in tile by tile.
+
+    In fit mode the owner supplies one pre-scaled image. Once the user zooms
+    in, the zoomed frame is cut into square tiles and only the tiles that
+    intersect the visible area are converted to PhotoImages, so an 8K capture
+    never needs a full-size PhotoImage.
+    """
+
+    def __init__(self, parent, on_fit=None):
+        """
+        Initialize the viewport.
+
+        Args:
+            parent: The parent widget
+            on_fit: Called when the viewport returns to fit mode
+        """
+        self.on_fit = on_fit
+        self.tile_size = Settings.PREVIEW_TILE_SIZE
+        self.cache_size = Settings.PREVIEW_TILE_CACHE_SIZE
+
+        self.canvas = tk.Canvas(parent, highlightthickness=0, borderwidth=0)
+
+        self.frame = None
+        self.zoom = None  # None while in fit mode
+        self.fit_scale = 1.0
+        self.offset_x = 0
+        self.offset_y = 0
+        self._drag_origin = None
+
+        self._fit_photo = None
+        # (frame id, zoom, column, row) -> PhotoImage, least recently used first
+        self._tile_cache = OrderedDict()
+        # (column, row) -> canvas item id of the tiles on screen
+        self._visible_items = {}
+        # (column, row) -> PhotoImage, keeps on-screen tiles alive past eviction
+        self._visible_photos = {}
+
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._zoom_at(ZOOM_STEP, event))
+        self.canvas.bind(
+            "<Button-5>", lambda event: self._zoom_at(1 / ZOOM_STEP, event)
+        )
+        self.canvas.bind("<ButtonPress-1>", self._on_drag_start)
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.fit())
+        self.canvas.bind("<Configure>", lambda event: self.refresh())
+
+    @property
+    def zoomed(self):
+        """Whether the viewport is zoomed in rather than fitting the frame"""
+        return self.zoom is not None
+
+    def set_frame(self, frame):
+        """Show a new frame, starting in fit mode.
+
+        Args:
+            frame: Shared Frame object; the viewport takes its own reference
+        """
+        frame.acquire()
+        self.clear()
+        self.frame = frame
+
+    def clear(self):
+        """Remove the frame and every cached tile."""
+        self.canvas.delete("all")
+        self._fit_photo = None
+        self._tile_cache.clear()
+        self._visible_items.clear()
+        self._visible_photos.clear()
+        self.zoom = None
+        if self.frame is not None:
+            self.frame.release()
+            self.frame = None
+
+    def show_fit_image(self, image):
+        """Display an image already scaled to fit, centered in the canvas.
+
+        Ignored while zoomed in.
+
+        Args:
+            image: PIL Image scaled from the current frame
+        """
+        if self.frame is None or self.zoomed:
+            return
+        self.fit_scale = image.width / self.frame.width
+        self._fit_photo = ImageTk.PhotoImage(image)
+        self.canvas.delete("fit")
+        self.canvas.create_image(
+            self.canvas.winfo_width() // 2,
+            self.canvas.winfo_height() // 2,
+            image=self._fit_photo,
+            anchor="center",
+            tags="fit",
+        )
+
+    def fit(self):
+        """Leave zoom mode and let the owner redraw the fitted image."""
+        if not self.zoomed:
+            return
+        self.zoom = None
+        self.canvas.delete("tile")
+        self._visible_items.clear()
+        self._visible_photos.clear()
+        if self.on_fit:
+            self.on_fit()
+
+    def refresh(self):
+        """Redraw the visible tiles, e.g. after the canvas was resized."""
+        if self.zoomed:
+            self._clamp_offset()
+            self._render_tiles(reposition=True)
+
+    def _on_mouse_wheel(self, event):
+        """Zoom in or out around the cursor on Windows and macOS."""
+        factor = ZOOM_STEP if event.delta > 0 else 1 / ZOOM_STEP
+        self._zoom_at(factor, event)
+
+    def _zoom_at(self, factor, event):
+        """Change the zoom, keeping the image point under the cursor fixed."""
+        if self.frame is None:
+            return
+
+        current = self.zoom if self.zoomed else self.fit_scale
+        new_zoom = min(MAX_ZOOM, current * factor)
+        if new_zoom <= self.fit_scale:
+            self.fit()
+            return
+
+        if not self.zoomed:
+            # Start from the fitted image's position on the canvas
+            self.canvas.delete("fit")
+            self.offset_x = (self.frame.width * current - self.canvas.winfo_width()) / 2
+            self.offset_y = (
+                self.frame.height * current - self.canvas.winfo_height()
+            ) / 2
+
+        image_x = (self.offset_x + event.x) / current
+        image_y = (self.offset_y + event.y) / current
+        self.zoom = round(new_zoom, 4)
+        self.offset_x = image_x * self.zoom - event.x
+        self.offset_y = image_y * self.zoom - event.y
+
+        self.canvas.delete("tile")
+        self._visible_items.clear()
+        self._visible_photos.clear()
+        self._clamp_offset()
+        self._render_tiles()
+
+    def _on_drag_start(self, event):
+        self._drag_origin = (event.x, event.y)
+
+    def _on_drag(self, event):
+        """Pan the zoomed image."""
+        if not self.zoomed or self._drag_origin is None:
+            return
+        last_x, last_y = self._drag_origin
+        self._drag_origin = (event.x, event.y)
+
+        old_x, old_y = self.offset_x, self.offset_y
+        self.offset_x += last_x - event.x
+        self.offset_y += last_y - event.y
+        self._clamp_offset()
+
+        self.canvas.move("tile", old_x - self.offset_x, old_y - self.offset_y)
+        self._render_tiles()
+
+    def _zoomed_size(self):
+        return (
+            math.ceil(self.frame.width * self.zoom),
+            math.ceil(self.frame.height * self.zoom),
+        )
+
+    def _clamp_offset(self):
+        """Keep the view inside the image, centering it when smaller than the canvas."""
+        zoomed_width, zoomed_height = self._zoomed_size()
+        view_width = self.canvas.winfo_width()
+        view_height = self.canvas.winfo_height()
+
+        if zoomed_width <= view_width:
+            self.offset_x = (zoomed_width - view_width) / 2
+        else:
+            self.offset_x = min(max(0, self.offset_x), zoomed_width - view_width)
+
+        if zoomed_height <= view_height:
+            self.offset_y = (zoomed_height - view_height) / 2
+        else:
+            self.offset_y = min(max(0, self.offset_y), zoomed_height - view_height)
+
+    def _render_tiles(self, reposition=False):
+        """Create the newly visible tiles and drop the ones scrolled out of view."""
+        zoomed_width, zoomed_height = self._zoomed_size()
+        size = self.tile_size
+
+        first_col = max(0, int(self.offset_x // size))
+        first_row = max(0, int(self.offset_y // size))
+        last_col = min(
+            (zoomed_width - 1) // size,
+            int((self.offset_x + self.canvas.winfo_width()) // size),
+        )
+        last_row = min(
+            (zoomed_height - 1) // size,
+            int((self.offset_y + self.canvas.winfo_height()) // size),
+        )
+        wanted = {
+            (col, row)
+            for col in range(first_col, last_col + 1)
+            for row in range(first_row, last_row + 1)
+        }
+
+        for position in list(self._visible_items):
+            if position not in wanted:
+                self.canvas.delete(self._visible_items.pop(position))
+                self._visible_photos.pop(position, None)
+
+        for col, row in wanted:
+            x = col * size - self.offset_x
+            y = row * size - self.offset_y
+            item = self._visible_items.get((col, row))
+            if item is not None:
+                if reposition:
+                    self.canvas.coords(item, x, y)
+                continue
+            photo = self._get_tile(col, row, zoomed_width, zoomed_height)
+            self._visible_photos[(col, row)] = photo
+            self._visible_items[(col, row)] = self.canvas.create_image(
+                x, y, image=photo, anchor="nw", tags="tile"
+            )
+
+    def _get_tile(self, col, row, zoomed_width, zoomed_height):
+        """Return a tile's PhotoImage from the LRU cache, building it on a miss."""
+        key = (self.frame.frame_id, self.zoom, col, row)
+        photo = self._tile_cache.get(key)
+        if photo is not None:
+            self._tile_cache.move_to_end(key)
+            return photo
+
+        size = self.tile_size
+        left = col * size
+        top = row * size
+        right = min(left + size, zoomed_width)
+        bottom = min(top + size, zoomed_height)
+
+        # Sample from the smallest pyramid level that still covers the zoom
+        level = self.frame.nearest_level(zoomed_width, zoomed_height)
+        scale_x = level.width / zoomed_width
+        scale_y = level.height / zoomed_height
+        box = (
+            left * scale_x,
+            top * scale_y,
+            min(level.width, right * scale_x),
+            min(level.height, bottom * scale_y),
+        )
+        tile = level.resize(
+            (right - left, bottom - top), Image.Resampling.BILINEAR, box=box
+        )
+
+        photo = ImageTk.PhotoImage(tile)
+        self._tile_cache[key] = photo
+        while len(self._tile_cache) > self.cache_size:
+            self._tile_cache.popitem(last=False)
+        return photo
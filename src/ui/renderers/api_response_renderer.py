@@ -2,17 +2,105 @@
 API Response Renderer for formatting and displaying API responses.
 """
 
+import weakref
 from src.utils.logger import get_logger
+from src.settings.settings import Settings
 
 logger = get_logger()
 
+# Text tags used by the renderer, configured once per widget
+TAG_STYLES = {
+    "title": {
+        "font": ("Helvetica", 12, "bold"),
+        "foreground": "#FFFFFF",
+        "background": "#0066cc",
+    },
+    "question_number": {
+        "font": ("Helvetica", 11, "bold"),
+        "foreground": "#FFFFFF",
+        "background": "#333333",
+    },
+    "question_text": {
+        "font": ("Helvetica", 10),
+        "foreground": "#000000",
+        "background": "#F5F5F5",
+    },
+    "section_header": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#FFFFFF",
+        "background": "#666666",
+    },
+    "correct_answer": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#006400",
+        "background": "#CCFFCC",
+    },
+    "incorrect_answer": {
+        "font": ("Helvetica", 10),
+        "foreground": "#000000",
+        "background": "#F8F8F8",
+    },
+    "explanation_text": {
+        "font": ("Helvetica", 10),
+        "foreground": "#000000",
+        "background": "#FFF8DC",
+    },
+    "confidence": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#FFFFFF",
+        "background": "#0066cc",
+    },
+    "separator": {"font": ("Helvetica", 1), "foreground": "#000000"},
+    "multiple_correct": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#FFFFFF",
+        "background": "#FF5722",
+    },
+    # Confidence meters share one tag per level instead of one tag per question
+    "meter_high": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#006400",
+        "background": "#CCFFCC",
+    },
+    "meter_medium": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#FF8C00",
+        "background": "#FFE4B5",
+    },
+    "meter_low": {
+        "font": ("Helvetica", 10, "bold"),
+        "foreground": "#B22222",
+        "background": "#FFCCCC",
+    },
+}
+
+
+class _RenderState:
+    """Progress of an incremental render into one text widget"""
+
+    def __init__(self, data):
+        self.data = data
+        self.next_idx = 0
+        self.job = None
+        # Text index of each rendered question's header, in question order
+        self.question_starts = []
+
 
 class APIResponseRenderer:
-    """Renderer for formatting and displaying API responses in a text widget."""
+    """Renderer for formatting and displaying API responses in a text widget.
+
+    Questions are built in Python as flat lists of text and tag arguments
+    and handed to the Text widget one chunk per insert call. The first
+    chunk, enough to fill the view, is inserted right away; the rest follow
+    in after_idle callbacks so large answer sets never block the Tk loop.
+    """
 
     def __init__(self):
         """Initialize the API response renderer."""
-        pass
+        # Text widgets whose tags are already configured
+        self._configured_widgets = weakref.WeakSet()
+        # Text widget -> _RenderState of its current render
+        self._states = weakref.WeakKeyDictionary()
 
     def render(self, text_widget, api_response):
         """
@@ -20,33 +108,163 @@ class APIResponseRenderer:
 
         Args:
             text_widget: The tkinter Text widget to render into
-            api_response: The API response dictionary
+            api_response: The decoded AnalysisResponse
         """
         logger.info("Rendering API response")
+        self.cancel(text_widget)
 
-        # Extract data from the API response
-        data = api_response.get("data")
-        if not data or not isinstance(data, list) or len(data) == 0:
+        if not api_response.ok:
+            self._set_text(text_widget, f"Analysis failed: {api_response.error}")
+            return
+        data = api_response.questions
+        if not data:
             self._set_text(text_widget, "Invalid API response format")
             return
 
         # Prepare the text widget
         self._prepare_text_widget(text_widget)
+        state = _RenderState(data)
+        self._states[text_widget] = state
 
-        # Render the header
-        self._render_header(text_widget)
-
-        # Process each question in the data
-        for idx, question_data in enumerate(data):
-            # Render the question and its answers
-            self._render_question(text_widget, question_data, idx)
+        # Header and the first chunk now, the remaining questions when idle
+        arguments = self._flatten(self._header_segments())
+        arguments.extend(self._chunk_arguments(state, Settings.RENDER_FIRST_CHUNK))
+        text_widget.insert("end", *arguments)
+        self._index_questions(text_widget, state)
 
         # Finish up
         text_widget.see("1.0")  # Scroll to the beginning
         text_widget.config(state="disabled")  # Disable editing
+        self._schedule_next_chunk(text_widget, state)
+
+    def begin_stream(self, text_widget):
+        """Clear the widget and show the header of an answer that is still arriving.
+
+        Args:
+            text_widget: The tkinter Text widget to render into
+        """
+        logger.info("Rendering streamed API response")
+        self.cancel(text_widget)
+        self._prepare_text_widget(text_widget)
+        self._states[text_widget] = _RenderState([])
+        text_widget.insert("end", *self._flatten(self._header_segments()))
+        text_widget.config(state="disabled")
+
+    def append_question(self, text_widget, question):
+        """Add one streamed question below the ones already shown.
+
+        Questions arriving in a burst are inserted together on the next idle.
+
+        Args:
+            text_widget: The tkinter Text widget passed to begin_stream
+            question: The Question that arrived
+        """
+        state = self._states.get(text_widget)
+        if state is None:
+            self.begin_stream(text_widget)
+            state = self._states[text_widget]
+        state.data.append(question)
+        if state.job is None:
+            self._schedule_next_chunk(text_widget, state)
+
+    def cancel(self, text_widget):
+        """Stop rendering the remaining chunks of the widget's current answer.
+
+        Args:
+            text_widget: The tkinter Text widget
+        """
+        state = self._states.pop(text_widget, None)
+        if state is not None and state.job is not None:
+            text_widget.after_cancel(state.job)
+
+    def question_count(self, text_widget):
+        """Return the number of questions in the widget's current answer.
+
+        Args:
+            text_widget: The tkinter Text widget
+        """
+        state = self._states.get(text_widget)
+        return len(state.data) if state is not None else 0
+
+    def jump_to(self, text_widget, number):
+        """Scroll to a question, rendering the chunks before it first if needed.
+
+        Args:
+            text_widget: The tkinter Text widget
+            number (int): 1-based position of the question
+
+        Returns:
+            bool: False if the answer has no such question
+        """
+        state = self._states.get(text_widget)
+        if state is None or not 1 <= number <= len(state.data):
+            return False
+
+        if number > len(state.question_starts):
+            # Render everything up to the question in one insert
+            self._render_chunk(text_widget, state, number - state.next_idx)
+
+        index = state.question_starts[number - 1]
+        text_widget.see("end")  # Park past the target so it lands at the top
+        text_widget.see(index)
+        return True
+
+    def _chunk_arguments(self, state, count):
+        """Build the insert arguments of the next count questions and advance."""
+        end = min(len(state.data), state.next_idx + count)
+        segments = []
+        for idx in range(state.next_idx, end):
+            segments.extend(self._question_segments(state.data[idx], idx))
+        state.next_idx = end
+        return self._flatten(segments)
+
+    def _render_chunk(self, text_widget, state, count):
+        """Append the next count questions with a single insert call."""
+        arguments = self._chunk_arguments(state, count)
+        if not arguments:
+            return
+        text_widget.config(state="normal")
+        text_widget.insert("end", *arguments)
+        text_widget.config(state="disabled")
+        self._index_questions(text_widget, state)
+
+    def _schedule_next_chunk(self, text_widget, state):
+        if state.next_idx < len(state.data):
+            state.job = text_widget.after_idle(
+                self._render_next_chunk, text_widget, state
+            )
+        else:
+            state.job = None
+
+    def _render_next_chunk(self, text_widget, state):
+        """after_idle callback: render one chunk unless a newer render replaced it"""
+        state.job = None
+        if self._states.get(text_widget) is not state:
+            return
+        self._render_chunk(text_widget, state, Settings.RENDER_CHUNK_SIZE)
+        self._schedule_next_chunk(text_widget, state)
+
+    def _index_questions(self, text_widget, state):
+        """Record where each question starts from the question_number tag ranges"""
+        ranges = text_widget.tag_ranges("question_number")
+        state.question_starts = [str(index) for index in ranges[::2]]
+
+    def build_document(self, data):
+        """Build the text and tag arguments of a full render without a widget.
+
+        Args:
+            data: List of Question objects
+
+        Returns:
+            list: Alternating text and tag arguments for Text.insert
+        """
+        segments = self._header_segments()
+        for idx, question in enumerate(data):
+            segments.extend(self._question_segments(question, idx))
+        return self._flatten(segments)
 
     def _prepare_text_widget(self, text_widget):
-        """Set up the text widget with the necessary styles.
+        """Clear the text widget and configure its tags on first use.
 
         Args:
             text_widget: The tkinter Text widget to configure
@@ -55,207 +273,95 @@ class APIResponseRenderer:
         text_widget.config(state="normal")
         text_widget.delete("1.0", "end")
 
+        if text_widget in self._configured_widgets:
+            return
+
         # Set the background color to white for better visibility
         text_widget.configure(background="#FFFFFF")
-
-        text_widget.tag_configure(
-            "title",
-            font=("Helvetica", 12, "bold"),
-            foreground="#FFFFFF",
-            background="#0066cc",
-        )
-
-        text_widget.tag_configure(
-            "question_number",
-            font=("Helvetica", 11, "bold"),
-            foreground="#FFFFFF",
-            background="#333333",
-        )
-
-        text_widget.tag_configure(
-            "question_text",
-            font=("Helvetica", 10),
-            foreground="#000000",
-            background="#F5F5F5",
-        )
-
-        text_widget.tag_configure(
-            "section_header",
-            font=("Helvetica", 10, "bold"),
-            foreground="#FFFFFF",
-            background="#666666",
-        )
-
-        text_widget.tag_configure(
-            "correct_answer",
-            font=("Helvetica", 10, "bold"),
-            foreground="#006400",
-            background="#CCFFCC",
-        )
-
-        text_widget.tag_configure(
-            "incorrect_answer",
-            font=("Helvetica", 10),
-            foreground="#000000",
-            background="#F8F8F8",
-        )
-
-        text_widget.tag_configure(
-            "explanation_text",
-            font=("Helvetica", 10),
-            foreground="#000000",
-            background="#FFF8DC",
-        )
-
-        text_widget.tag_configure(
-            "confidence",
-            font=("Helvetica", 10, "bold"),
-            foreground="#FFFFFF",
-            background="#0066cc",
-        )
-
-        text_widget.tag_configure(
-            "separator", font=("Helvetica", 1), foreground="#000000"
-        )
-
-        text_widget.tag_configure(
-            "multiple_correct",
-            font=("Helvetica", 10, "bold"),
-            foreground="#FFFFFF",
-            background="#FF5722",
-        )
-
-    def _render_header(self, text_widget):
-        """Render the header section of the response.
+        for tag, style in TAG_STYLES.items():
+            text_widget.tag_configure(tag, **style)
+        self._configured_widgets.add(text_widget)
+
+    @staticmethod
+    def _flatten(segments):
+        """Turn (text, tag) tuples into Text.insert's chars tagList chars ... form"""
+        arguments = []
+        for text, tag in segments:
+            arguments.append(text)
+            arguments.append(tag)
+        return arguments
+
+    def _header_segments(self):
+        """Return the header section of the response as (text, tag) segments."""
+        return [("EXAM QUESTION ANALYSIS\n", "title")]
+
+    def _question_segments(self, question, idx):
+        """Return a single question with its answers and explanation as segments.
 
         Args:
-            text_widget: The tkinter Text widget to render into
+            question: The Question to render
+            idx: The index of the question in the list
+
+        Returns:
+            list: (text, tag) tuples
         """
-        text_widget.insert("end", "EXAM QUESTION ANALYSIS\n", "title")
+        segments = [
+            (f"Question {question.number}:\n", "question_number"),
+            (f"{question.text}\n\n", "question_text"),
+        ]
 
-    def _render_question(self, text_widget, question_data, idx):
-        """Render a single question with its answers and explanation.
+        # Answer choices
+        segments.extend(self._answer_choice_segments(question))
 
-        Args:
-            text_widget: The tkinter Text widget to render into
-            question_data: Dictionary containing the question data
-            idx: The index of the question in the list
-        """
-        # Extract question details
-        question_number = question_data.get("number", f"Q{idx+1}")
-        question_text = question_data.get("question_raw", "N/A")
-        answer_raw = question_data.get("answer_raw", [])
-        correct_answers = question_data.get("answer", [])
-        reason = question_data.get("reason", "N/A")
-        question_type = question_data.get("type_question", "N/A")
-        accuracy = question_data.get("accuracy", "N/A")
-
-        text_widget.insert("end", f"Question {question_number}:\n", "question_number")
-        text_widget.insert("end", f"{question_text}\n\n", "question_text")
-
-        # Render answer choices
-        self._render_answer_choices(
-            text_widget, question_type, correct_answers, answer_raw
-        )
-
-        # Render explanation
-        text_widget.insert("end", "EXPLANATION:\n", "section_header")
-        text_widget.insert("end", f"{reason}\n\n", "explanation_text")
-
-        # Render confidence meter
-        self._render_confidence_meter(text_widget, accuracy, idx)
-
-    def _render_answer_choices(
-        self, text_widget, question_type, correct_answers, answer_raw
-    ):
-        """Render the answer choices for a question.
+        # Explanation
+        segments.append(("EXPLANATION:\n", "section_header"))
+        segments.append((f"{question.reason}\n\n", "explanation_text"))
 
-        Args:
-            text_widget: The tkinter Text widget to render into
-            question_type: question_type
-            correct_answers: List or string of correct answer identifiers
-            answer_raw: List of answer choice texts
-            question_text: The full question text
-        """
-        # Render choices header
-        if question_type == "single-choice":
-            text_widget.insert("end", "CHOICES (Single Answer):\n", "section_header")
-        else:
-            text_widget.insert("end", "CHOICES (Multiple Answers):\n", "section_header")
+        # Confidence meter
+        segments.extend(self._confidence_meter_segments(question.confidence))
+        return segments
 
-        # Render each choice
-        for i, choice in enumerate(answer_raw):
-            choice_id = None
-            choice_text = choice
+    def _answer_choice_segments(self, question):
+        """Return the answer choices for a question as segments.
 
-            if choice.strip() and choice.strip()[0].isdigit() and ". " in choice:
-                parts = choice.split(". ", 1)
-                if len(parts) == 2:
-                    choice_id = parts[0].strip()
-                    choice_text = parts[1].strip()
+        Args:
+            question: The Question whose choices are rendered
 
-            if not choice_id:
-                choice_id = chr(65 + i) if i < 26 else str(i + 1)
+        Returns:
+            list: (text, tag) tuples
+        """
+        # Choices header
+        if question.single_choice:
+            segments = [("CHOICES (Single Answer):\n", "section_header")]
+        else:
+            segments = [("CHOICES (Multiple Answers):\n", "section_header")]
 
+        for choice in question.choices:
             # Check if the answer is correct or not
-            is_correct = correct_answers[i]
-            prefix = "☑ " if is_correct else "☐ "
-            tag = "correct_answer" if is_correct else "incorrect_answer"
-
-            # Insert the formatted choice
-            if choice_id in choice_text:
-                text_widget.insert("end", f"{prefix}{choice_text}\n", tag)
+            if choice.correct:
+                segments.append((f"☑ {choice.label}\n", "correct_answer"))
             else:
-                text_widget.insert("end", f"{prefix}{choice_id}. {choice_text}\n", tag)
+                segments.append((f"☐ {choice.label}\n", "incorrect_answer"))
+        return segments
 
-    def _render_confidence_meter(self, text_widget, accuracy, idx):
-        """Render the confidence meter for a question.
+    def _confidence_meter_segments(self, confidence):
+        """Return the confidence meter for a question as segments.
 
         Args:
-            text_widget: The tkinter Text widget to render into
-            accuracy: The accuracy value (string or numeric)
-            idx: The index of the question
+            confidence: The question's Confidence
+
+        Returns:
+            list: (text, tag) tuples
         """
-        text_widget.insert("end", "CONFIDENCE: ", "section_header")
-
-        if isinstance(accuracy, str) and "%" in accuracy:
-            try:
-                accuracy_value = int(accuracy.strip("%"))
-
-                # Configure colors based on confidence level
-                if accuracy_value >= 80:
-                    # High confidence - green color
-                    meter_color = "#006400"
-                    bg_color = "#CCFFCC"
-                elif accuracy_value >= 50:
-                    # Medium confidence - orange color
-                    meter_color = "#FF8C00"
-                    bg_color = "#FFE4B5"
-                else:
-                    # Low confidence - red color
-                    meter_color = "#B22222"
-                    bg_color = "#FFCCCC"
-
-                # Create image icon for the meter
-                meter = "█" * (accuracy_value // 20) + "░" * (5 - accuracy_value // 20)
-
-                # Display confidence value
-                text_widget.insert("end", f"{accuracy} ", "confidence")
-
-                # Configure tag for meter with custom text and background colors
-                text_widget.tag_configure(
-                    f"meter_{idx}",
-                    foreground=meter_color,
-                    background=bg_color,
-                    font=("Helvetica", 10, "bold"),
-                )
-
-                # Display meter with custom colors
-                text_widget.insert("end", f"{meter}\n", f"meter_{idx}")
-            except ValueError:
-                text_widget.insert("end", f"{accuracy}\n", "confidence")
+        segments = [("CONFIDENCE: ", "section_header")]
+
+        if confidence.level is None:
+            segments.append((f"{confidence.raw}\n", "confidence"))
         else:
-            text_widget.insert("end", f"{accuracy}\n", "confidence")
+            # Shared meter tag for the confidence level
+            segments.append((f"{confidence.raw} ", "confidence"))
+            segments.append((f"{confidence.meter}\n", f"meter_{confidence.level}"))
+        return segments
 
     def _set_text(self, text_widget, message):
         """Set a simple message in the text widget.
@@ -0,0 +1,77 @@
+"""
+Dispatcher that hands results from worker threads back to the Tk main loop.
+"""
+
+import queue
+import tkinter as tk
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class MainThreadDispatcher:
+    """Single queue drained on the Tk main loop for callbacks posted by other threads."""
+
+    def __init__(self, widget, interval_ms=25):
+        """
+        Initialize the dispatcher and start draining its queue.
+
+        Args:
+            widget: Any Tk widget whose main loop should run the callbacks
+            interval_ms: How often the queue is drained, in milliseconds
+        """
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self._queue = queue.SimpleQueue()
+        self._poll()
+
+    def post(self, callback, *args):
+        """Schedule a callback on the main loop. Safe to call from any thread.
+
+        Args:
+            callback: Callable to run on the main loop
+            *args: Positional arguments for the callback
+        """
+        self._queue.put((callback, args))
+
+    def bind_future(self, future, callback, error_callback=None):
+        """Deliver the result of a future to the main loop once it completes.
+
+        Cancelled futures are dropped silently.
+
+        Args:
+            future: A concurrent.futures.Future
+            callback: Called on the main loop with the result
+            error_callback: Called on the main loop with the exception, if any
+        """
+
+        def on_done(done_future):
+            if done_future.cancelled():
+                return
+            error = done_future.exception()
+            if error is None:
+                self.post(callback, done_future.result())
+            elif error_callback:
+                self.post(error_callback, error)
+            else:
+                logger.error(f"Background task failed: {str(error)}")
+
+        future.add_done_callback(on_done)
+
+    def _poll(self):
+        """Run every pending callback, then re-arm the timer"""
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Dispatched callback failed: {str(e)}")
+
+        try:
+            self.widget.after(self.interval_ms, self._poll)
+        except tk.TclError:
+            # The widget was destroyed, stop polling
+            pass